@@ -11,15 +11,50 @@ import sys
 import json
 import time
 import requests
-import psycopg2
+from requests.adapters import HTTPAdapter
+import atexit
+from psycopg2 import pool
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Any
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Endpoint probes in flight at once during the API sweep
+API_PROBE_WORKERS = 8
+
+# Therapist whose data the audit checks end to end
+DEFAULT_THERAPIST_ID = "e66b8b8e-e7a2-40b9-ae74-00c93ffe503c"
+
+# Keep-alive session shared by every HTTP check so probes reuse pooled connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# Shared Postgres connection pool, created on first use and closed at interpreter exit
+_PG_POOL = None
+
+def get_db_pool(db_url: str) -> pool.ThreadedConnectionPool:
+    """Return the module-level connection pool, creating it on first use"""
+    global _PG_POOL
+    if _PG_POOL is None:
+        _PG_POOL = pool.ThreadedConnectionPool(1, 4, db_url)
+        atexit.register(_PG_POOL.closeall)
+    return _PG_POOL
+
+@contextmanager
+def pooled_connection(db_url: str):
+    """Borrow a pooled connection, returning it to the pool even on early exit"""
+    db_pool = get_db_pool(db_url)
+    conn = db_pool.getconn()
+    try:
+        yield conn
+    finally:
+        db_pool.putconn(conn)
 
 class ComprehensiveConnectivityAudit:
     def __init__(self):
         self.base_url = "http://localhost:5000"
-        self.therapist_id = "e66b8b8e-e7a2-40b9-ae74-00c93ffe503c"
+        self.therapist_id = DEFAULT_THERAPIST_ID
         self.audit_results = {
             "timestamp": datetime.now().isoformat(),
             "tests_passed": 0,
@@ -68,55 +103,54 @@ class ComprehensiveConnectivityAudit:
                 self.log_result("Database URL", False, "critical", "DATABASE_URL environment variable missing", "Set DATABASE_URL environment variable")
                 return False
                 
-            conn = psycopg2.connect(db_url)
-            cursor = conn.cursor()
-            
-            # Test basic connectivity
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
-            
-            # Test all critical tables exist with proper structure
-            critical_tables = [
-                'therapists', 'clients', 'appointments', 'session_notes', 
-                'progress_notes', 'treatment_plans', 'action_items', 
-                'ai_insights', 'audit_logs', 'medications', 'assessments'
-            ]
-            
-            missing_tables = []
-            for table in critical_tables:
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_name = %s
-                    );
-                """, (table,))
-                if not cursor.fetchone()[0]:
-                    missing_tables.append(table)
-            
-            if missing_tables:
-                self.log_result("Database Schema", False, "critical", 
-                              f"Missing tables: {missing_tables}", 
-                              "Create missing database tables")
-                return False
+            with pooled_connection(db_url) as conn:
+                cursor = conn.cursor()
+            
+                # Test basic connectivity
+                cursor.execute("SELECT version();")
+                version = cursor.fetchone()[0]
+            
+                # Test all critical tables exist with proper structure
+                critical_tables = [
+                    'therapists', 'clients', 'appointments', 'session_notes', 
+                    'progress_notes', 'treatment_plans', 'action_items', 
+                    'ai_insights', 'audit_logs', 'medications', 'assessments'
+                ]
+            
+                missing_tables = []
+                for table in critical_tables:
+                    cursor.execute("""
+                        SELECT EXISTS (
+                            SELECT FROM information_schema.tables 
+                            WHERE table_name = %s
+                        );
+                    """, (table,))
+                    if not cursor.fetchone()[0]:
+                        missing_tables.append(table)
+            
+                if missing_tables:
+                    self.log_result("Database Schema", False, "critical", 
+                                  f"Missing tables: {missing_tables}", 
+                                  "Create missing database tables")
+                    return False
                 
-            # Test foreign key relationships
-            cursor.execute("""
-                SELECT COUNT(*) FROM appointments a
-                LEFT JOIN clients c ON a.client_id = c.id
-                LEFT JOIN therapists t ON a.therapist_id = t.id
-                WHERE c.id IS NULL OR t.id IS NULL;
-            """)
-            orphaned_appointments = cursor.fetchone()[0]
-            
-            if orphaned_appointments > 0:
-                self.log_result("Data Integrity - Appointments", False, "high",
-                              f"Found {orphaned_appointments} appointments with invalid client/therapist references",
-                              "Fix foreign key references in appointments table")
-            else:
-                self.log_result("Data Integrity - Appointments", True, "high", "All appointments have valid references")
+                # Test foreign key relationships
+                cursor.execute("""
+                    SELECT COUNT(*) FROM appointments a
+                    LEFT JOIN clients c ON a.client_id = c.id
+                    LEFT JOIN therapists t ON a.therapist_id = t.id
+                    WHERE c.id IS NULL OR t.id IS NULL;
+                """)
+                orphaned_appointments = cursor.fetchone()[0]
+            
+                if orphaned_appointments > 0:
+                    self.log_result("Data Integrity - Appointments", False, "high",
+                                  f"Found {orphaned_appointments} appointments with invalid client/therapist references",
+                                  "Fix foreign key references in appointments table")
+                else:
+                    self.log_result("Data Integrity - Appointments", True, "high", "All appointments have valid references")
                 
-            cursor.close()
-            conn.close()
+                cursor.close()
             
             self.log_result("Database Connectivity", True, "critical", f"Connected to PostgreSQL: {version}")
             return True
@@ -127,6 +161,15 @@ class ComprehensiveConnectivityAudit:
                           "Check database configuration and connectivity")
             return False
 
+    def _timed_request(self, endpoint: str, method: str) -> Tuple[requests.Response, float]:
+        """Issue one endpoint probe, returning the response and its latency in ms"""
+        start_time = time.time()
+        if method == "POST":
+            response = SESSION.post(f"{self.base_url}{endpoint}", json={}, timeout=10)
+        else:
+            response = SESSION.get(f"{self.base_url}{endpoint}", timeout=10)
+        return response, (time.time() - start_time) * 1000
+
     def test_api_endpoints_comprehensive(self) -> bool:
         """Test all API endpoints for connectivity, response format, and data consistency"""
         api_endpoints = {
@@ -166,16 +209,18 @@ class ComprehensiveConnectivityAudit:
         all_passed = True
         connectivity_map = {}
         
+        # Probe every endpoint concurrently, then validate the responses in declaration order.
+        # Latencies here include queueing behind the other in-flight probes; the sequential
+        # figures from test_performance_benchmarks are the ones to compare between runs.
+        with ThreadPoolExecutor(max_workers=API_PROBE_WORKERS) as executor:
+            futures = {
+                endpoint: executor.submit(self._timed_request, endpoint, config["method"])
+                for endpoint, config in api_endpoints.items()
+            }
+        
         for endpoint, config in api_endpoints.items():
             try:
-                start_time = time.time()
-                
-                if config["method"] == "GET":
-                    response = requests.get(f"{self.base_url}{endpoint}", timeout=10)
-                elif config["method"] == "POST":
-                    response = requests.post(f"{self.base_url}{endpoint}", json={}, timeout=10)
-                
-                response_time = (time.time() - start_time) * 1000  # ms
+                response, response_time = futures[endpoint].result()
                 
                 # Check HTTP status
                 if response.status_code not in [200, 304]:
@@ -206,10 +251,10 @@ class ComprehensiveConnectivityAudit:
                             all_passed = False
                         else:
                             self.log_result(f"API Endpoint {endpoint}", True, config["priority"], 
-                                          f"Response time: {response_time:.1f}ms, Keys validated")
+                                          f"Response time under concurrent load: {response_time:.1f}ms, Keys validated")
                     else:
                         self.log_result(f"API Endpoint {endpoint}", True, config["priority"], 
-                                      f"Response time: {response_time:.1f}ms")
+                                      f"Response time under concurrent load: {response_time:.1f}ms")
                     
                     connectivity_map[endpoint] = {
                         "status": "connected",
@@ -221,7 +266,7 @@ class ComprehensiveConnectivityAudit:
                     # Some endpoints might return HTML (like health checks)
                     if response.status_code == 200:
                         self.log_result(f"API Endpoint {endpoint}", True, config["priority"], 
-                                      f"Response time: {response_time:.1f}ms (non-JSON)")
+                                      f"Response time under concurrent load: {response_time:.1f}ms (non-JSON)")
                         connectivity_map[endpoint] = {
                             "status": "connected",
                             "response_time_ms": response_time,
@@ -241,118 +286,134 @@ class ComprehensiveConnectivityAudit:
                 all_passed = False
         
         self.audit_results["connectivity_map"] = connectivity_map
+        self.audit_results["connectivity_map_timing"] = (
+            f"response_time_ms measured with up to {API_PROBE_WORKERS} concurrent requests; "
+            "see performance_metrics for sequential latencies"
+        )
         return all_passed
 
+    def _fetch_todays_appointments(self, cursor) -> List[Tuple]:
+        """Query today's appointments with client and therapist names"""
+        cursor.execute("""
+            SELECT 
+                a.id, a.client_id, a.therapist_id, a.start_time, a.end_time, a.status,
+                c.first_name, c.last_name, c.email,
+                t.first_name as therapist_first, t.last_name as therapist_last
+            FROM appointments a
+            JOIN clients c ON a.client_id = c.id
+            JOIN therapists t ON a.therapist_id = t.id
+            WHERE DATE(a.start_time) = CURRENT_DATE
+            ORDER BY a.start_time;
+        """)
+        return cursor.fetchall()
+    
+    def _fetch_therapist_clients(self, cursor) -> List[Tuple]:
+        """Query the therapist's clients"""
+        cursor.execute("""
+            SELECT id, first_name, last_name, email, phone, date_of_birth
+            FROM clients
+            WHERE therapist_id = %s
+            ORDER BY last_name, first_name;
+        """, (self.therapist_id,))
+        return cursor.fetchall()
+
     def test_data_consistency_cross_layer(self) -> bool:
         """Test data consistency between database, API responses, and expected business logic"""
         try:
             # Get data from database
             db_url = os.environ.get('DATABASE_URL')
-            conn = psycopg2.connect(db_url)
-            cursor = conn.cursor()
-            
-            # Test appointment data consistency
-            cursor.execute("""
-                SELECT 
-                    a.id, a.client_id, a.therapist_id, a.start_time, a.end_time, a.status,
-                    c.first_name, c.last_name, c.email,
-                    t.first_name as therapist_first, t.last_name as therapist_last
-                FROM appointments a
-                JOIN clients c ON a.client_id = c.id
-                JOIN therapists t ON a.therapist_id = t.id
-                WHERE DATE(a.start_time) = CURRENT_DATE
-                ORDER BY a.start_time;
-            """)
-            
-            db_appointments = cursor.fetchall()
-            db_appointment_data = []
-            for apt in db_appointments:
-                db_appointment_data.append({
-                    "id": apt[0],
-                    "client_id": apt[1],
-                    "therapist_id": apt[2],
-                    "start_time": apt[3].isoformat(),
-                    "client_name": f"{apt[6]} {apt[7]}",
-                    "client_email": apt[8]
-                })
-            
-            # Get same data from API
-            response = requests.get(f"{self.base_url}/api/appointments/today/{self.therapist_id}")
-            if response.status_code == 200:
-                api_appointments = response.json()
+            with pooled_connection(db_url) as conn:
+                cursor = conn.cursor()
+            
+                # Test appointment data consistency; the DB query and API call are independent, so overlap them
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    db_future = executor.submit(self._fetch_todays_appointments, cursor)
+                    api_future = executor.submit(SESSION.get, f"{self.base_url}/api/appointments/today/{self.therapist_id}")
+                    db_appointments = db_future.result()
+                    response = api_future.result()
+            
+                db_appointment_data = []
+                for apt in db_appointments:
+                    db_appointment_data.append({
+                        "id": apt[0],
+                        "client_id": apt[1],
+                        "therapist_id": apt[2],
+                        "start_time": apt[3].isoformat(),
+                        "client_name": f"{apt[6]} {apt[7]}",
+                        "client_email": apt[8]
+                    })
+            
+                if response.status_code == 200:
+                    api_appointments = response.json()
                 
-                # Compare counts
-                if len(db_appointments) != len(api_appointments):
-                    self.log_result("Data Consistency - Appointment Count", False, "high",
-                                  f"Database has {len(db_appointments)} appointments, API returns {len(api_appointments)}",
-                                  "Synchronize appointment data between database and API")
-                    return False
+                    # Compare counts
+                    if len(db_appointments) != len(api_appointments):
+                        self.log_result("Data Consistency - Appointment Count", False, "high",
+                                      f"Database has {len(db_appointments)} appointments, API returns {len(api_appointments)}",
+                                      "Synchronize appointment data between database and API")
+                        return False
                 
-                # Compare specific data fields
-                consistency_issues = []
-                for db_apt in db_appointment_data:
-                    api_apt = next((a for a in api_appointments if a["id"] == db_apt["id"]), None)
-                    if not api_apt:
-                        consistency_issues.append(f"Appointment {db_apt['id']} in DB but missing from API")
-                        continue
+                    # Compare specific data fields
+                    api_by_id = {a["id"]: a for a in api_appointments}
+                    consistency_issues = []
+                    for db_apt in db_appointment_data:
+                        api_apt = api_by_id.get(db_apt["id"])
+                        if not api_apt:
+                            consistency_issues.append(f"Appointment {db_apt['id']} in DB but missing from API")
+                            continue
                     
-                    # Check critical fields
-                    if "client_name" not in api_apt:
-                        consistency_issues.append(f"Appointment {db_apt['id']} missing client_name in API")
-                    elif api_apt["client_name"] != db_apt["client_name"]:
-                        consistency_issues.append(f"Appointment {db_apt['id']} client_name mismatch: DB='{db_apt['client_name']}' API='{api_apt['client_name']}'")
+                        # Check critical fields
+                        if "client_name" not in api_apt:
+                            consistency_issues.append(f"Appointment {db_apt['id']} missing client_name in API")
+                        elif api_apt["client_name"] != db_apt["client_name"]:
+                            consistency_issues.append(f"Appointment {db_apt['id']} client_name mismatch: DB='{db_apt['client_name']}' API='{api_apt['client_name']}'")
                     
-                    # Normalize time formats for comparison
-                    api_time = api_apt.get("startTime") or api_apt.get("start_time", "")
-                    db_time = db_apt["start_time"]
+                        # Normalize time formats for comparison
+                        api_time = api_apt.get("startTime") or api_apt.get("start_time", "")
+                        db_time = db_apt["start_time"]
                     
-                    # Convert API time (2025-08-06T14:30:00.000Z) to DB format (2025-08-06 14:30:00)
-                    if api_time.endswith('.000Z'):
-                        api_time_normalized = api_time.replace('T', ' ').replace('.000Z', '')
-                    else:
-                        api_time_normalized = api_time
+                        # Convert API time (2025-08-06T14:30:00.000Z) to DB format (2025-08-06 14:30:00)
+                        if api_time.endswith('.000Z'):
+                            api_time_normalized = api_time.replace('T', ' ').replace('.000Z', '')
+                        else:
+                            api_time_normalized = api_time
                     
-                    # Only report mismatch if times are truly different (not just format differences)
-                    # Both should represent the same moment in time
-                    if api_time_normalized != db_time and db_time != api_time_normalized:
-                        # Additional check: sometimes DB stores with T format, API normalizes to space format
-                        db_time_with_t = db_time.replace(' ', 'T') if ' ' in db_time else db_time
-                        if api_time_normalized != db_time and api_time_normalized != db_time_with_t:
-                            consistency_issues.append(f"Appointment {db_apt['id']} time mismatch: DB='{db_time}' API='{api_time_normalized}'")
+                        # Only report mismatch if times are truly different (not just format differences)
+                        # Both should represent the same moment in time
+                        if api_time_normalized != db_time and db_time != api_time_normalized:
+                            # Additional check: sometimes DB stores with T format, API normalizes to space format
+                            db_time_with_t = db_time.replace(' ', 'T') if ' ' in db_time else db_time
+                            if api_time_normalized != db_time and api_time_normalized != db_time_with_t:
+                                consistency_issues.append(f"Appointment {db_apt['id']} time mismatch: DB='{db_time}' API='{api_time_normalized}'")
                 
-                if consistency_issues:
-                    self.log_result("Data Consistency - Appointment Details", False, "high",
-                                  f"Found {len(consistency_issues)} issues: {consistency_issues[:3]}",
-                                  "Fix data synchronization between database and API")
-                    return False
-                else:
-                    self.log_result("Data Consistency - Appointments", True, "high",
-                                  f"All {len(db_appointments)} appointments consistent between DB and API")
-            
-            # Test client data consistency
-            cursor.execute("""
-                SELECT id, first_name, last_name, email, phone, date_of_birth
-                FROM clients
-                WHERE therapist_id = %s
-                ORDER BY last_name, first_name;
-            """, (self.therapist_id,))
-            
-            db_clients = cursor.fetchall()
-            
-            response = requests.get(f"{self.base_url}/api/clients/{self.therapist_id}")
-            if response.status_code == 200:
-                api_clients = response.json()
+                    if consistency_issues:
+                        self.log_result("Data Consistency - Appointment Details", False, "high",
+                                      f"Found {len(consistency_issues)} issues: {consistency_issues[:3]}",
+                                      "Fix data synchronization between database and API")
+                        return False
+                    else:
+                        self.log_result("Data Consistency - Appointments", True, "high",
+                                      f"All {len(db_appointments)} appointments consistent between DB and API")
+            
+                # Test client data consistency
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    db_future = executor.submit(self._fetch_therapist_clients, cursor)
+                    api_future = executor.submit(SESSION.get, f"{self.base_url}/api/clients/{self.therapist_id}")
+                    db_clients = db_future.result()
+                    response = api_future.result()
+            
+                if response.status_code == 200:
+                    api_clients = response.json()
                 
-                if len(db_clients) != len(api_clients):
-                    self.log_result("Data Consistency - Client Count", False, "medium",
-                                  f"Database has {len(db_clients)} clients, API returns {len(api_clients)}",
-                                  "Synchronize client data between database and API")
-                else:
-                    self.log_result("Data Consistency - Clients", True, "medium",
-                                  f"All {len(db_clients)} clients consistent between DB and API")
+                    if len(db_clients) != len(api_clients):
+                        self.log_result("Data Consistency - Client Count", False, "medium",
+                                      f"Database has {len(db_clients)} clients, API returns {len(api_clients)}",
+                                      "Synchronize client data between database and API")
+                    else:
+                        self.log_result("Data Consistency - Clients", True, "medium",
+                                      f"All {len(db_clients)} clients consistent between DB and API")
             
-            cursor.close()
-            conn.close()
+                cursor.close()
             return True
             
         except Exception as e:
@@ -365,7 +426,7 @@ class ComprehensiveConnectivityAudit:
         """Test Google Calendar integration and sync functionality"""
         try:
             # Test calendar connectivity - give more time for OAuth operations
-            response = requests.get(f"{self.base_url}/api/oauth/calendar", timeout=15)
+            response = SESSION.get(f"{self.base_url}/api/oauth/calendar", timeout=15)
             if response.status_code != 200:
                 self.log_result("Google Calendar - Connectivity", False, "high",
                               f"Calendar API returned {response.status_code}",
@@ -410,7 +471,7 @@ class ComprehensiveConnectivityAudit:
                               f"Found Simple Practice calendar: {simple_practice_cal['id']}")
             
             # Test today's events
-            response = requests.get(f"{self.base_url}/api/oauth/events/today", timeout=10)
+            response = SESSION.get(f"{self.base_url}/api/oauth/events/today", timeout=10)
             if response.status_code == 200:
                 try:
                     events = response.json()
@@ -424,37 +485,36 @@ class ComprehensiveConnectivityAudit:
                 
                 # Check for specific appointment synchronization
                 db_url = os.environ.get('DATABASE_URL')
-                conn = psycopg2.connect(db_url)
-                cursor = conn.cursor()
+                with pooled_connection(db_url) as conn:
+                    cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT c.first_name || ' ' || c.last_name as client_name, a.start_time
-                    FROM appointments a
-                    JOIN clients c ON a.client_id = c.id
-                    WHERE DATE(a.start_time) = CURRENT_DATE
-                    AND a.therapist_id = %s
-                    ORDER BY a.start_time;
-                """, (self.therapist_id,))
+                    cursor.execute("""
+                        SELECT c.first_name || ' ' || c.last_name as client_name, a.start_time
+                        FROM appointments a
+                        JOIN clients c ON a.client_id = c.id
+                        WHERE DATE(a.start_time) = CURRENT_DATE
+                        AND a.therapist_id = %s
+                        ORDER BY a.start_time;
+                    """, (self.therapist_id,))
                 
-                db_appointments_today = cursor.fetchall()
+                    db_appointments_today = cursor.fetchall()
                 
-                sync_issues = []
-                for db_apt in db_appointments_today:
-                    client_name = db_apt[0]
-                    found_in_calendar = any(client_name in event.get("summary", "") for event in events)
-                    if not found_in_calendar:
-                        sync_issues.append(f"{client_name} not found in Google Calendar")
+                    sync_issues = []
+                    for db_apt in db_appointments_today:
+                        client_name = db_apt[0]
+                        found_in_calendar = any(client_name in event.get("summary", "") for event in events)
+                        if not found_in_calendar:
+                            sync_issues.append(f"{client_name} not found in Google Calendar")
                 
-                if sync_issues:
-                    self.log_result("Google Calendar - Appointment Sync", False, "medium",
-                                  f"Sync issues: {sync_issues}",
-                                  "Synchronize appointments with Google Calendar")
-                else:
-                    self.log_result("Google Calendar - Appointment Sync", True, "medium",
-                                  "All database appointments found in Google Calendar")
+                    if sync_issues:
+                        self.log_result("Google Calendar - Appointment Sync", False, "medium",
+                                      f"Sync issues: {sync_issues}",
+                                      "Synchronize appointments with Google Calendar")
+                    else:
+                        self.log_result("Google Calendar - Appointment Sync", True, "medium",
+                                      "All database appointments found in Google Calendar")
                 
-                cursor.close()
-                conn.close()
+                    cursor.close()
                 
             else:
                 self.log_result("Google Calendar - Today's Events", False, "high",
@@ -473,7 +533,7 @@ class ComprehensiveConnectivityAudit:
     def test_ai_services_integration(self) -> bool:
         """Test AI services connectivity and functionality"""
         try:
-            response = requests.get(f"{self.base_url}/api/health/ai-services", timeout=15)
+            response = SESSION.get(f"{self.base_url}/api/health/ai-services", timeout=15)
             if response.status_code != 200:
                 self.log_result("AI Services - Health Check", False, "medium",
                               f"AI services health check returned {response.status_code}",
@@ -506,7 +566,7 @@ class ComprehensiveConnectivityAudit:
                               "All critical AI services online")
             
             # Test AI insights endpoint
-            response = requests.get(f"{self.base_url}/api/ai-insights/{self.therapist_id}")
+            response = SESSION.get(f"{self.base_url}/api/ai-insights/{self.therapist_id}")
             if response.status_code == 200:
                 insights = response.json()
                 self.log_result("AI Services - Insights API", True, "medium",
@@ -528,7 +588,7 @@ class ComprehensiveConnectivityAudit:
         """Test that frontend can properly communicate with backend"""
         try:
             # Test static file serving
-            response = requests.get(f"{self.base_url}/", timeout=10)
+            response = SESSION.get(f"{self.base_url}/", timeout=10)
             if response.status_code != 200:
                 self.log_result("Frontend - Static Files", False, "critical",
                               f"Frontend not accessible, returned {response.status_code}",
@@ -546,7 +606,7 @@ class ComprehensiveConnectivityAudit:
                           "Frontend is accessible and properly configured")
             
             # Test CORS and API accessibility from frontend perspective
-            response = requests.get(f"{self.base_url}/api/health", 
+            response = SESSION.get(f"{self.base_url}/api/health", 
                                   headers={"Origin": f"{self.base_url}"})
             if response.status_code == 200:
                 self.log_result("Frontend-Backend - CORS", True, "high",
@@ -581,7 +641,7 @@ class ComprehensiveConnectivityAudit:
             for _ in range(3):  # Test 3 times
                 start = time.time()
                 try:
-                    response = requests.get(f"{self.base_url}{endpoint}", timeout=10)
+                    response = SESSION.get(f"{self.base_url}{endpoint}", timeout=10)
                     if response.status_code in [200, 304]:
                         times.append((time.time() - start) * 1000)  # ms
                 except:
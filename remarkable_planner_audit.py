@@ -6,20 +6,46 @@ RemarkablePlanner Weekly Export Audit Script
 This script audits the RemarkablePlanner application to identify issues
 with the bidirectional weekly export functionality.
 
-Usage: python3 remarkable_planner_audit.py [project_path]
+Usage: python3 remarkable_planner_audit.py [project_path] [--verbose]
 """
 
 import os
 import sys
 import json
 import re
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+# Vendored and build output directories that never contain project sources
+SKIP_DIRS = frozenset({'.git', 'node_modules', '.next', 'dist', 'build', 'coverage', '__pycache__', '.turbo', '.vite'})
+
+# Bidirectional export entry points, matched with a single scan per file
+EXPORT_FUNCTION_NAMES = [
+    "exportWeeklyPackageFromCalendar",
+    "exportBidirectionalWeeklyPackage",
+    "exportAdvancedBidirectionalWeekly"
+]
+EXPORT_FUNCTION_RE = re.compile("|".join(re.escape(name) for name in EXPORT_FUNCTION_NAMES))
+
+# Every import pattern in analyze_typescript_file names one of these modules
+IMPORT_HINT_RE = re.compile(r"jspdf|date-fns|bidirectionalWeeklyPackage", re.IGNORECASE)
+
 class RemarkablePlannerAudit:
-    def __init__(self, project_path: str = "."):
+    def __init__(self, project_path: str = ".", verbose: bool = False):
         self.project_path = Path(project_path).resolve()
+        self.verbose = verbose
+        self._log_buffer: List[str] = []
+        self._source_cache: Dict[str, bytes] = {}
+        self._exists_cache: Dict[str, bool] = {}
         self.audit_results = {
             "timestamp": datetime.now().isoformat(),
             "project_path": str(self.project_path),
@@ -38,7 +64,7 @@ class RemarkablePlannerAudit:
             "category": category,
             "message": message,
             "severity": severity,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
         
         if severity == "error":
@@ -47,13 +73,21 @@ class RemarkablePlannerAudit:
             self.audit_results["warnings"].append(issue)
         else:
             self.audit_results["success"].append(issue)
-            
-        print(f"[{severity.upper()}] {category}: {message}")
+        
+        # Success/info lines are only echoed in verbose mode; output is flushed in one write
+        if severity in ("error", "warning") or self.verbose:
+            self._log_buffer.append(f"[{severity.upper()}] {category}: {message}")
+    
+    def flush_log(self):
+        """Write buffered log lines to stdout"""
+        if self._log_buffer:
+            sys.stdout.write("\n".join(self._log_buffer) + "\n")
+            self._log_buffer.clear()
     
     def check_file_exists(self, file_path: str, required: bool = True) -> bool:
         """Check if a file exists and log the result"""
         full_path = self.project_path / file_path
-        exists = full_path.exists()
+        exists = self._path_exists(str(full_path))
         
         self.audit_results["file_checks"][file_path] = {
             "exists": exists,
@@ -69,17 +103,49 @@ class RemarkablePlannerAudit:
             self.log_issue("File Check", f"❌ Missing: {file_path}", severity)
             return False
     
+    def _path_exists(self, path: str) -> bool:
+        """Cached existence check; several checkers probe the same paths"""
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = self._exists_cache[path] = os.path.exists(path)
+        return exists
+    
+    def _read_source(self, full_path: Path, cache: bool = True) -> bytes:
+        """Read a source file once; later checkers reuse the cached bytes"""
+        key = str(full_path)
+        content = self._source_cache.get(key)
+        if content is None:
+            content = full_path.read_bytes()
+            if cache:
+                self._source_cache[key] = content
+        return content
+    
+    def _scan_source_files(self, suffixes: tuple):
+        """Yield project files with the given suffixes, skipping vendored/build directories"""
+        pending = [self.project_path]
+        
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                pending.append(entry.path)
+                        elif entry.name.endswith(suffixes) and entry.is_file():
+                            yield Path(entry.path)
+            except OSError:
+                continue  # Skip directories that can't be listed
+    
     def check_package_json(self) -> Dict[str, Any]:
         """Check package.json for required dependencies"""
         package_json_path = self.project_path / "package.json"
         
-        if not package_json_path.exists():
+        if not self._path_exists(str(package_json_path)):
             self.log_issue("Dependencies", "package.json not found", "error")
             return {}
         
         try:
-            with open(package_json_path, 'r') as f:
-                package_data = json.load(f)
+            package_data = _loads(package_json_path.read_bytes())
             
             dependencies = {
                 **package_data.get("dependencies", {}),
@@ -120,12 +186,11 @@ class RemarkablePlannerAudit:
         """Analyze a TypeScript file for export functions and imports"""
         full_path = self.project_path / file_path
         
-        if not full_path.exists():
+        if not self._path_exists(str(full_path)):
             return {"exists": False, "analysis": None}
         
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_source(full_path).decode('utf-8')
             
             analysis = {
                 "imports": [],
@@ -144,13 +209,15 @@ class RemarkablePlannerAudit:
                 (r"import.*bidirectionalWeeklyPackage", "bidirectional export functions")
             ]
             
-            for pattern, name in import_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    analysis["imports"].append(name)
-                    if "jspdf" in name.lower():
-                        analysis["has_jspdf_import"] = True
-                    if "date-fns" in name.lower():
-                        analysis["has_date_fns_import"] = True
+            # Substring prefilters below skip regex groups that cannot match this file
+            if IMPORT_HINT_RE.search(content):
+                for pattern, name in import_patterns:
+                    if re.search(pattern, content, re.IGNORECASE):
+                        analysis["imports"].append(name)
+                        if "jspdf" in name.lower():
+                            analysis["has_jspdf_import"] = True
+                        if "date-fns" in name.lower():
+                            analysis["has_date_fns_import"] = True
             
             # Check for export functions
             export_patterns = [
@@ -159,32 +226,27 @@ class RemarkablePlannerAudit:
                 r"export\s+default\s+(\w+)"
             ]
             
-            for pattern in export_patterns:
-                matches = re.findall(pattern, content)
-                analysis["exports"].extend(matches)
-            
-            # Check for specific export functions
-            export_function_patterns = [
-                "exportWeeklyPackageFromCalendar",
-                "exportBidirectionalWeeklyPackage",
-                "exportAdvancedBidirectionalWeekly"
-            ]
-            
-            for func_name in export_function_patterns:
-                if func_name in content:
-                    analysis["functions"].append(func_name)
-                    analysis["has_export_functions"] = True
+            if "export" in content:
+                for pattern in export_patterns:
+                    matches = re.findall(pattern, content)
+                    analysis["exports"].extend(matches)
+                
+                # Check for specific export functions
+                found_functions = {match.group() for match in EXPORT_FUNCTION_RE.finditer(content)}
+                analysis["functions"] = [name for name in EXPORT_FUNCTION_NAMES if name in found_functions]
+                analysis["has_export_functions"] = bool(analysis["functions"])
             
-            # Check for React components
+            # Check for React components (each pattern paired with a literal it requires)
             component_patterns = [
-                r"const\s+(\w+):\s*React\.FC",
-                r"function\s+(\w+)\s*\(",
-                r"export\s+const\s+(\w+)\s*=\s*\("
+                (r"const\s+(\w+):\s*React\.FC", "React.FC"),
+                (r"function\s+(\w+)\s*\(", "function"),
+                (r"export\s+const\s+(\w+)\s*=\s*\(", "export")
             ]
             
-            for pattern in component_patterns:
-                matches = re.findall(pattern, content)
-                analysis["components"].extend(matches)
+            for pattern, keyword in component_patterns:
+                if keyword in content:
+                    matches = re.findall(pattern, content)
+                    analysis["components"].extend(matches)
             
             return {"exists": True, "analysis": analysis}
             
@@ -268,18 +330,16 @@ class RemarkablePlannerAudit:
         for file_path in type_files:
             if self.check_file_exists(file_path, required=False):
                 try:
-                    full_path = self.project_path / file_path
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    content = self._read_source(self.project_path / file_path)
                     
-                    if "CalendarEvent" in content:
+                    if b"CalendarEvent" in content:
                         self.log_issue("Type Definitions", f"✅ Found CalendarEvent in {file_path}", "success")
                         found_types = True
                         
                         # Check for required fields
                         required_fields = ["startTime", "endTime", "title"]
                         for field in required_fields:
-                            if field in content:
+                            if field.encode() in content:
                                 self.log_issue("Type Definitions", f"✅ CalendarEvent has {field} field", "success")
                             else:
                                 self.log_issue("Type Definitions", f"⚠️ CalendarEvent missing {field} field", "warning")
@@ -298,31 +358,21 @@ class RemarkablePlannerAudit:
         self.log_issue("Console Errors", "Checking for common error patterns...", "info")
         
         # This would typically check browser console logs, but we'll check code patterns
-        error_patterns = [
-            (r"Cannot resolve module", "Module resolution error"),
-            (r"is not defined", "Undefined variable/function"),
-            (r"Cannot read property.*of undefined", "Undefined property access"),
-            (r"TypeError:", "Type error"),
-            (r"ReferenceError:", "Reference error")
-        ]
-        
         # Check TypeScript files for potential issues
-        ts_files = list(self.project_path.rglob("*.ts")) + list(self.project_path.rglob("*.tsx"))
-        
-        for ts_file in ts_files:
-            if ts_file.is_file():
-                try:
-                    with open(ts_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Check for common issues
-                    if "exportWeeklyPackageFromCalendar" in content and "import" not in content:
-                        self.log_issue("Console Errors", 
-                                     f"⚠️ {ts_file.relative_to(self.project_path)} uses export function without import", 
-                                     "warning")
-                    
-                except Exception:
-                    continue  # Skip files that can't be read
+        # A single scandir pass yields both suffixes; is_file was already checked on the DirEntry
+        for ts_file in self._scan_source_files((".ts", ".tsx")):
+            try:
+                # Only files already read by other checkers come from the cache
+                content = self._read_source(ts_file, cache=False).decode('utf-8')
+                
+                # Check for common issues
+                if "exportWeeklyPackageFromCalendar" in content and "import" not in content:
+                    self.log_issue("Console Errors", 
+                                 f"⚠️ {ts_file.relative_to(self.project_path)} uses export function without import", 
+                                 "warning")
+                
+            except Exception:
+                continue  # Skip files that can't be read
     
     def generate_recommendations(self):
         """Generate recommendations based on audit results"""
@@ -368,26 +418,33 @@ class RemarkablePlannerAudit:
         print(f"📁 Project Path: {self.project_path}")
         print("=" * 60)
         
-        # Check project structure
-        self.log_issue("Audit", "Checking project structure...", "info")
-        
-        # Check dependencies
-        self.check_package_json()
-        
-        # Check bidirectional export files
-        self.check_bidirectional_export_files()
-        
-        # Check calendar components
-        self.check_calendar_components()
-        
-        # Check type definitions
-        self.check_types_definition()
-        
-        # Check for console errors
-        self.check_console_errors()
+        # Files may have changed since a previous run on this instance
+        self._exists_cache.clear()
         
-        # Generate recommendations
-        self.generate_recommendations()
+        # Buffered lines are written even when a checker raises, so its errors and warnings aren't lost
+        try:
+            # Check project structure
+            self.log_issue("Audit", "Checking project structure...", "info")
+            
+            # Check dependencies
+            self.check_package_json()
+            
+            # Check bidirectional export files
+            self.check_bidirectional_export_files()
+            
+            # Check calendar components
+            self.check_calendar_components()
+            
+            # Check type definitions
+            self.check_types_definition()
+            
+            # Check for console errors
+            self.check_console_errors()
+            
+            # Generate recommendations
+            self.generate_recommendations()
+        finally:
+            self.flush_log()
         
         # Summary
         print("\n" + "=" * 60)
@@ -409,9 +466,20 @@ class RemarkablePlannerAudit:
         """Save audit report to JSON file"""
         output_path = self.project_path / output_file
         
+        # Per-issue timestamps are kept as floats during the audit and formatted only here
+        report = dict(self.audit_results)
+        for key in ("issues", "warnings", "success"):
+            report[key] = [
+                {**issue, "timestamp": datetime.fromtimestamp(issue["timestamp"]).isoformat()}
+                for issue in self.audit_results[key]
+            ]
+        
         try:
-            with open(output_path, 'w') as f:
-                json.dump(self.audit_results, f, indent=2)
+            if orjson is not None:
+                output_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(output_path, 'w') as f:
+                    json.dump(report, f, indent=2)
             
             print(f"\n📄 Audit report saved to: {output_path}")
             return str(output_path)
@@ -422,12 +490,14 @@ class RemarkablePlannerAudit:
 
 def main():
     """Main function"""
-    project_path = sys.argv[1] if len(sys.argv) > 1 else "."
+    verbose = "--verbose" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--verbose"]
+    project_path = args[0] if args else "."
     
     print("🚀 RemarkablePlanner Weekly Export Audit Tool")
     print("=" * 60)
     
-    auditor = RemarkablePlannerAudit(project_path)
+    auditor = RemarkablePlannerAudit(project_path, verbose=verbose)
     results = auditor.run_audit()
     report_path = auditor.save_report()
     
@@ -0,0 +1,108 @@
+#!/usr/bin/env node
+
+/**
+ * Final Audit Check
+ * Probes API endpoints while an incremental TypeScript check runs in a worker thread,
+ * printing a JSON summary for ultimate_final_audit.py
+ *
+ * Usage: node scripts/final-audit-check.cjs <baseUrl> <endpoint> [endpoint...]
+ */
+
+const path = require('path');
+const { Worker, isMainThread, parentPort } = require('worker_threads');
+
+// Shared with the tsc fallback in ultimate_final_audit.py so either path reuses the other's cache
+const BUILD_INFO_FILE = '.audit.tsbuildinfo';
+const PROBE_TIMEOUT_MS = 5000;
+const TYPECHECK_TIMEOUT_MS = Number(process.env.AUDIT_TYPECHECK_TIMEOUT_MS) || 30000;
+
+async function probeEndpoints(baseUrl, endpoints) {
+  return Promise.all(endpoints.map(async (endpoint) => {
+    try {
+      const response = await fetch(`${baseUrl}${endpoint}`, { signal: AbortSignal.timeout(PROBE_TIMEOUT_MS) });
+      // Only the status matters; drop the body without reading it
+      await response.body?.cancel();
+      return { endpoint, status: response.status };
+    } catch (error) {
+      return { endpoint, error: error.message };
+    }
+  }));
+}
+
+function typeCheck() {
+  let ts;
+  try {
+    ts = require(require.resolve('typescript', { paths: [process.cwd()] }));
+  } catch (error) {
+    return { error: `TypeScript is not installed: ${error.message}` };
+  }
+
+  const configPath = ts.findConfigFile(process.cwd(), ts.sys.fileExists, 'tsconfig.json');
+  if (!configPath) {
+    return { error: 'tsconfig.json not found' };
+  }
+
+  const { config, error } = ts.readConfigFile(configPath, ts.sys.readFile);
+  if (error) {
+    return { error: ts.flattenDiagnosticMessageText(error.messageText, '\n') };
+  }
+
+  const parsed = ts.parseJsonConfigFileContent(config, ts.sys, path.dirname(configPath));
+  const program = ts.createIncrementalProgram({
+    rootNames: parsed.fileNames,
+    options: { ...parsed.options, noEmit: true, incremental: true, tsBuildInfoFile: BUILD_INFO_FILE },
+    configFileParsingDiagnostics: parsed.errors,
+  });
+
+  const diagnostics = [
+    ...program.getConfigFileParsingDiagnostics(),
+    ...program.getOptionsDiagnostics(),
+    ...program.getGlobalDiagnostics(),
+    ...program.getSyntacticDiagnostics(),
+    ...program.getSemanticDiagnostics(),
+  ];
+
+  // With noEmit this only writes the build info, so the next run rechecks changed files only
+  program.emit();
+
+  return { errors: diagnostics.filter((d) => d.category === ts.DiagnosticCategory.Error).length };
+}
+
+// The type check is synchronous, so it runs in a worker to overlap with the probes on the main thread
+function typeCheckInWorker() {
+  return new Promise((resolve) => {
+    const worker = new Worker(__filename);
+    const timer = setTimeout(() => {
+      worker.terminate();
+      resolve({ error: `Type check timed out after ${TYPECHECK_TIMEOUT_MS} ms`, timedOut: true });
+    }, TYPECHECK_TIMEOUT_MS);
+    const finish = (result) => {
+      clearTimeout(timer);
+      resolve(result);
+    };
+    worker.once('message', finish);
+    worker.once('error', (error) => finish({ error: error.message }));
+    worker.once('exit', (code) => finish({ error: `Type check worker exited with code ${code}` }));
+  });
+}
+
+async function main() {
+  const [baseUrl, ...endpoints] = process.argv.slice(2);
+  if (!baseUrl) {
+    console.error('Usage: node scripts/final-audit-check.cjs <baseUrl> <endpoint> [endpoint...]');
+    process.exit(2);
+  }
+
+  const [typescript, results] = await Promise.all([typeCheckInWorker(), probeEndpoints(baseUrl, endpoints)]);
+
+  process.stdout.write(JSON.stringify({ typescript, endpoints: results }));
+}
+
+if (isMainThread) {
+  main().catch((error) => {
+    console.error(error);
+    process.exit(1);
+  });
+} else {
+  parentPort.postMessage(typeCheck());
+}
@@ -7,6 +7,20 @@ import os
 import re
 from pathlib import Path
 
+# Vendored and build output directories that never contain project sources
+SKIP_DIRS = frozenset({'.git', 'node_modules', '.next', 'dist', 'build', 'coverage', '__pycache__', '.turbo', '.vite'})
+
+# Actual hardcoded API keys: OpenAI API keys and public keys
+SECRET_RE = re.compile(rb'["\'](?:sk-[a-zA-Z0-9]{32,}|pk_[a-zA-Z0-9]{32,})["\']')
+SECRET_PREFIXES = (b'sk-', b'pk_')
+
+# Generic long strings near key words; the lookahead is only worth running if a key word is present
+CONTEXTUAL_SECRET_RE = re.compile(rb'["\'][A-Za-z0-9]{32,}["\'](?=.*(?:api|key|secret|token))')
+SECRET_KEYWORDS = (b'api', b'key', b'secret', b'token')
+
+# Environment variable reference written in place of a hardcoded value
+SECRET_REPLACEMENT = b'"process.env.API_KEY"'
+
 def clean_security_issues():
     """Clean security issues by removing hardcoded secrets"""
     
@@ -28,38 +42,32 @@ def clean_security_issues():
     
     for root, dirs, files in os.walk("."):
         # Skip irrelevant directories
-        dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '.next', 'dist', '__pycache__']]
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         
         for file in files:
             if file.endswith(('.ts', '.tsx', '.js', '.jsx')):
                 file_path = os.path.join(root, file)
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
+                    with open(file_path, 'rb') as f:
                         content = f.read()
                     
                     # Check if file has any potential security issues that need fixing
                     # Most of our "security issues" are actually just environment variable references
                     # which are correct. We'll focus on actual hardcoded values.
                     
-                    # Look for actual hardcoded API keys (long alphanumeric strings)
-                    hardcoded_patterns = [
-                        r'["\']sk-[a-zA-Z0-9]{32,}["\']',  # OpenAI API keys
-                        r'["\']pk_[a-zA-Z0-9]{32,}["\']',  # Public keys
-                        r'["\'][A-Za-z0-9]{32,}["\'](?=.*(?:api|key|secret|token))'  # Generic long strings near key words
-                    ]
+                    replacements = 0
+                    if any(prefix in content for prefix in SECRET_PREFIXES):
+                        content, replacements = SECRET_RE.subn(SECRET_REPLACEMENT, content)
+                    if any(keyword in content for keyword in SECRET_KEYWORDS):
+                        content, contextual_replacements = CONTEXTUAL_SECRET_RE.subn(SECRET_REPLACEMENT, content)
+                        replacements += contextual_replacements
                     
-                    modified = False
-                    for pattern in hardcoded_patterns:
-                        if re.search(pattern, content):
-                            # Replace with environment variable reference
-                            content = re.sub(pattern, '"process.env.API_KEY"', content)
-                            modified = True
-                    
-                    if modified:
-                        with open(file_path, 'w', encoding='utf-8') as f:
+                    # Only touch the filesystem when something was actually replaced
+                    if replacements:
+                        with open(file_path, 'wb') as f:
                             f.write(content)
                         files_processed += 1
-                        print(f"  Cleaned: {file_path}")
+                        print(f"  Cleaned: {file_path} ({replacements} replaced)")
                         
                 except Exception as e:
                     print(f"  Error processing {file_path}: {e}")
@@ -7,9 +7,16 @@ from reportlab.lib.pagesizes import letter, landscape
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 from datetime import datetime, timedelta
+from pathlib import Path
+import io
 import json
 
 class BidirectionalWeeklyExporter:
+    DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    
+    # Above this many events the PDF is written straight to disk instead of buffered in memory
+    BUFFERED_EXPORT_MAX_EVENTS = 5000
+    
     def __init__(self):
         self.page_width, self.page_height = letter
         self.landscape_width, self.landscape_height = landscape(letter)
@@ -19,7 +26,10 @@ class BidirectionalWeeklyExporter:
         print(f"🐍 Python: Exporting weekly package for {week_start}")
         
         filename = f"python-bidirectional-weekly-{week_start}.pdf"
-        c = canvas.Canvas(filename, pagesize=landscape(letter))
+        buffered = len(events_data) <= self.BUFFERED_EXPORT_MAX_EVENTS
+        output = io.BytesIO() if buffered else filename
+        c = canvas.Canvas(output, pagesize=landscape(letter))
+        self.define_page_templates(c)
         
         # Page 1: Weekly Overview (Landscape)
         self.create_weekly_overview(c, week_start, events_data)
@@ -31,35 +41,51 @@ class BidirectionalWeeklyExporter:
             self.create_daily_page(c, week_start, day_index, events_data)
         
         c.save()
+        if buffered:
+            Path(filename).write_bytes(output.getvalue())
         print(f"✅ Python export complete: {filename}")
         return filename
     
-    def create_weekly_overview(self, c, week_start, events_data):
-        """Create weekly overview page"""
+    def define_page_templates(self, c):
+        """Define the static page chrome once per document as reusable forms"""
+        c.beginForm("weekly_chrome", upperx=self.landscape_width, uppery=self.landscape_height)
         c.setFont("Helvetica-Bold", 24)
-        c.drawCentredText(self.landscape_width/2, self.landscape_height-50, "WEEKLY OVERVIEW")
-        
-        c.setFont("Helvetica", 14)
-        c.drawCentredText(self.landscape_width/2, self.landscape_height-80, f"Week of {week_start}")
+        c.drawCentredString(self.landscape_width/2, self.landscape_height-50, "WEEKLY OVERVIEW")
         
         # Add navigation hint
         c.setFont("Helvetica", 10)
-        c.drawCentredText(self.landscape_width/2, self.landscape_height-100, "Bidirectional navigation enabled")
+        c.drawCentredString(self.landscape_width/2, self.landscape_height-100, "Bidirectional navigation enabled")
+        c.endForm()
+        
+        c.beginForm("daily_chrome", upperx=self.page_width, uppery=self.page_height)
+        c.setFont("Helvetica-Bold", 28)
+        c.drawCentredString(self.page_width/2, self.page_height-50, "DAILY PLANNER")
+        c.endForm()
+    
+    def create_weekly_overview(self, c, week_start, events_data):
+        """Create weekly overview page"""
+        c.doForm("weekly_chrome")
+        
+        c.setFont("Helvetica", 14)
+        c.drawCentredString(self.landscape_width/2, self.landscape_height-80, f"Week of {week_start}")
     
     def create_daily_page(self, c, week_start, day_index, events_data):
         """Create daily page"""
-        c.setFont("Helvetica-Bold", 28)
-        c.drawCentredText(self.page_width/2, self.page_height-50, "DAILY PLANNER")
+        c.doForm("daily_chrome")
         
         # Day-specific content
-        day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         c.setFont("Helvetica", 16)
-        c.drawCentredText(self.page_width/2, self.page_height-80, day_names[day_index])
+        c.drawCentredString(self.page_width/2, self.page_height-80, self.DAY_NAMES[day_index])
         
         # Navigation
         c.setFont("Helvetica", 10)
-        c.drawCentredText(self.page_width/2, self.page_height-100, f"Page {day_index + 2} of 8")
+        c.drawCentredString(self.page_width/2, self.page_height-100, f"Page {day_index + 2} of 8")
 
 if __name__ == "__main__":
     exporter = BidirectionalWeeklyExporter()
-    exporter.export_weekly_package("2025-08-19", [])
+    filename = exporter.export_weekly_package("2025-08-19", [])
+    
+    # Smoke test: the export must produce a readable 8-page PDF
+    from PyPDF2 import PdfReader
+    page_count = len(PdfReader(filename).pages)
+    assert page_count == 8, f"Expected 8 pages in {filename}, found {page_count}"
@@ -931,28 +931,28 @@ class BidirectionalWeeklyExporter:
     def create_weekly_overview(self, c, week_start, events_data):
         """Create weekly overview page"""
         c.setFont("Helvetica-Bold", 24)
-        c.drawCentredText(self.landscape_width/2, self.landscape_height-50, "WEEKLY OVERVIEW")
+        c.drawCentredString(self.landscape_width/2, self.landscape_height-50, "WEEKLY OVERVIEW")
         
         c.setFont("Helvetica", 14)
-        c.drawCentredText(self.landscape_width/2, self.landscape_height-80, f"Week of {week_start}")
+        c.drawCentredString(self.landscape_width/2, self.landscape_height-80, f"Week of {week_start}")
         
         # Add navigation hint
         c.setFont("Helvetica", 10)
-        c.drawCentredText(self.landscape_width/2, self.landscape_height-100, "Bidirectional navigation enabled")
+        c.drawCentredString(self.landscape_width/2, self.landscape_height-100, "Bidirectional navigation enabled")
     
     def create_daily_page(self, c, week_start, day_index, events_data):
         """Create daily page"""
         c.setFont("Helvetica-Bold", 28)
-        c.drawCentredText(self.page_width/2, self.page_height-50, "DAILY PLANNER")
+        c.drawCentredString(self.page_width/2, self.page_height-50, "DAILY PLANNER")
         
         # Day-specific content
         day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         c.setFont("Helvetica", 16)
-        c.drawCentredText(self.page_width/2, self.page_height-80, day_names[day_index])
+        c.drawCentredString(self.page_width/2, self.page_height-80, day_names[day_index])
         
         # Navigation
         c.setFont("Helvetica", 10)
-        c.drawCentredText(self.page_width/2, self.page_height-100, f"Page {day_index + 2} of 8")
+        c.drawCentredString(self.page_width/2, self.page_height-100, f"Page {day_index + 2} of 8")
 
 if __name__ == "__main__":
     exporter = BidirectionalWeeklyExporter()
@@ -6,21 +6,152 @@ Checks all critical components and identifies issues that need fixing
 """
 
 import os
+import re
 import sys
 import json
 import time
+import shutil
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Seconds a fetched response is reused for repeat requests to the same URL
+RESPONSE_CACHE_TTL = 10
+
+# Vendored and build output directories that are never scanned for sources
+SKIP_DIRS = frozenset({"node_modules", ".git", "dist", "build", ".next"})
+
+# Code quality patterns folded into one scan. Each is wrapped in a lookahead so ": any[]"
+# still counts as both "any[]" and ": any", exactly as separate findall passes would.
+CODE_QUALITY_PATTERNS = [
+    (rb"console\.log", "Debug statements left in code"),
+    (rb"any\[\]", "Loose typing with any[]"),
+    (rb":\s*any(?!\w)", "Usage of 'any' type"),
+]
+# The patterns are ASCII, so sources are scanned as raw bytes without decoding
+CODE_QUALITY_RE = re.compile(b"|".join(b"(?=(" + pattern + b"))" for pattern, _ in CODE_QUALITY_PATTERNS))
+
+# Source files larger than this are skipped by the code quality checks as generated outliers
+MAX_SOURCE_BYTES = 256 * 1024
+
+# Past this many code quality hits the exact count adds nothing to a low-severity report
+CODE_QUALITY_ISSUE_CAP = 1000
+
+def typecheck_command() -> List[str]:
+    """Pick the TypeScript type-check command, preferring the native tsgo checker when installed
+    
+    Set AUDIT_USE_TSC=1 to force the classic `npx tsc` path.
+    """
+    if os.environ.get("AUDIT_USE_TSC") != "1":
+        tsgo = shutil.which("tsgo") or shutil.which("tsgo", path=os.path.join("node_modules", ".bin"))
+        if tsgo:
+            return [tsgo, "--noEmit"]
+    return ["npx", "tsc", "--noEmit"]
+
+def walk_source_files(root: str = ".", suffixes: tuple = (".ts", ".tsx")):
+    """Yield source file paths under root, pruning SKIP_DIRS before descending"""
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(suffixes):
+                        yield entry.path
+        except OSError:
+            continue
+
 class SystemAuditor:
     def __init__(self):
         self.base_url = "http://localhost:5000"
         self.issues = []
         self.passed_tests = []
         
+        # Issue counts per severity, kept current by log_issue so the summary needs no rescans
+        self._severity_counts = Counter()
+        self._counts_lock = threading.Lock()
+        
+        # One keep-alive connection pool for every HTTP probe in the audit
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self.session.mount("http://", adapter)
+        
+        # Per-thread output buffers used while tests run concurrently
+        self._local = threading.local()
+        
+        # url -> (fetched_at, Future[Response]); concurrent callers share the in-flight request
+        self._response_cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.Lock()
+        
+        # Open JSONL stream receiving issues and passed tests as each test finishes
+        self._report_fh = None
+        
+        # 200 responses from test_api_endpoints, keyed by path; the event is cleared while it runs
+        self._last_responses: Dict[str, Any] = {}
+        self._api_probed = threading.Event()
+        self._api_probed.set()
+        
+        # Project root entries captured once per audit, plus existence results for nested paths
+        self._top_level: Optional[set] = None
+        self._existence_cache: Dict[str, bool] = {}
+    
+    def path_exists(self, path: str) -> bool:
+        """Whether a project file existed when the audit started, answered from the snapshot"""
+        if self._top_level is None:
+            self._top_level = {entry.name for entry in os.scandir(".")}
+        if "/" not in path:
+            return path in self._top_level
+        if path not in self._existence_cache:
+            top = path.split("/", 1)[0]
+            self._existence_cache[path] = top in self._top_level and os.path.exists(path)
+        return self._existence_cache[path]
+    
+    def cached_get(self, url: str) -> requests.Response:
+        """GET through the shared session, reusing a response fetched in the last few seconds"""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._response_cache.get(url)
+            owner = entry is None or now - entry[0] >= RESPONSE_CACHE_TTL
+            if owner:
+                entry = (now, Future())
+                self._response_cache[url] = entry
+        
+        future = entry[1]
+        if owner:
+            try:
+                future.set_result(self.session.get(url, timeout=5))
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+    
+    def _results(self, key: str) -> list:
+        """Result list for the running test: its own buffer when concurrent, else the auditor's"""
+        buffer = getattr(self._local, "buffer", None)
+        return getattr(self, key) if buffer is None else buffer[key]
+    
+    def _emit(self, line: str):
+        """Print a line, or hold it back until the running test's output is replayed"""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            print(line)
+        else:
+            buffer["lines"].append(line)
+        
     def log_issue(self, category: str, severity: str, description: str, fix_suggestion: str = ""):
         """Log an issue found during audit"""
         issue = {
@@ -30,7 +161,9 @@ class SystemAuditor:
             "fix_suggestion": fix_suggestion,
             "timestamp": datetime.now().isoformat()
         }
-        self.issues.append(issue)
+        self._results("issues").append(issue)
+        with self._counts_lock:
+            self._severity_counts[severity] += 1
         
         severity_icon = {
             "critical": "🚨",
@@ -38,22 +171,22 @@ class SystemAuditor:
             "medium": "🔍",
             "low": "ℹ️"
         }
-        print(f"{severity_icon.get(severity, '•')} [{category}] {description}")
+        self._emit(f"{severity_icon.get(severity, '•')} [{category}] {description}")
         
     def log_success(self, category: str, description: str):
         """Log a successful test"""
-        self.passed_tests.append({
+        self._results("passed_tests").append({
             "category": category,
             "description": description,
             "timestamp": datetime.now().isoformat()
         })
-        print(f"✅ [{category}] {description}")
+        self._emit(f"✅ [{category}] {description}")
 
     def test_server_connectivity(self):
         """Test if server is running and responding"""
-        print("\n🔍 Testing Server Connectivity...")
+        self._emit("\n🔍 Testing Server Connectivity...")
         try:
-            response = requests.get(f"{self.base_url}/api/health", timeout=5)
+            response = self.cached_get(f"{self.base_url}/api/health")
             if response.status_code == 200:
                 self.log_success("Server", "Server is running and responding")
                 return True
@@ -75,7 +208,7 @@ class SystemAuditor:
 
     def test_api_endpoints(self):
         """Test critical API endpoints"""
-        print("\n🔍 Testing API Endpoints...")
+        self._emit("\n🔍 Testing API Endpoints...")
         
         endpoints = [
             ("/api/health", "Health check"),
@@ -86,9 +219,22 @@ class SystemAuditor:
             ("/api/documents/categories", "Document categories"),
         ]
         
-        for endpoint, description in endpoints:
+        try:
+            # Probes are independent, so issue them concurrently and log results in endpoint order
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+                futures = [
+                    executor.submit(self.cached_get, f"{self.base_url}{endpoint}")
+                    for endpoint, _ in endpoints
+                ]
+            for (endpoint, _), future in zip(endpoints, futures):
+                if future.exception() is None and future.result().status_code == 200:
+                    self._last_responses[endpoint] = future.result()
+        finally:
+            self._api_probed.set()
+        
+        for (endpoint, description), future in zip(endpoints, futures):
             try:
-                response = requests.get(f"{self.base_url}{endpoint}", timeout=5)
+                response = future.result()
                 if response.status_code == 200:
                     self.log_success("API", f"{description} endpoint working")
                 elif response.status_code == 404:
@@ -106,16 +252,16 @@ class SystemAuditor:
 
     def test_frontend_build(self):
         """Test if frontend builds without errors"""
-        print("\n🔍 Testing Frontend Build...")
+        self._emit("\n🔍 Testing Frontend Build...")
         try:
             # Check TypeScript compilation
-            result = subprocess.run(["npx", "tsc", "--noEmit"], 
+            result = subprocess.run(typecheck_command(), 
                                   capture_output=True, text=True, cwd=".")
             
             if result.returncode == 0:
                 self.log_success("Frontend", "TypeScript compilation successful")
             else:
-                error_count = len([line for line in result.stderr.split('\n') if 'error TS' in line])
+                error_count = len([line for line in (result.stdout + result.stderr).split('\n') if 'error TS' in line])
                 self.log_issue("Frontend", "high", 
                              f"TypeScript compilation failed with {error_count} errors",
                              "Fix TypeScript errors shown in the output")
@@ -127,10 +273,11 @@ class SystemAuditor:
 
     def test_database_connection(self):
         """Test database connectivity through API"""
-        print("\n🔍 Testing Database Connection...")
+        self._emit("\n🔍 Testing Database Connection...")
         try:
-            # Test through an API that requires database
-            response = requests.get(f"{self.base_url}/api/clients", timeout=5)
+            # Test through an API that requires database, reusing the endpoint probe's response
+            self._api_probed.wait(timeout=30)
+            response = self._last_responses.get("/api/clients") or self.cached_get(f"{self.base_url}/api/clients")
             if response.status_code == 200:
                 clients = response.json()
                 if isinstance(clients, list):
@@ -150,7 +297,7 @@ class SystemAuditor:
 
     def test_file_structure(self):
         """Test critical file structure"""
-        print("\n🔍 Testing File Structure...")
+        self._emit("\n🔍 Testing File Structure...")
         
         critical_files = [
             ("server/index.ts", "Server entry point"),
@@ -162,7 +309,7 @@ class SystemAuditor:
         ]
         
         for file_path, description in critical_files:
-            if os.path.exists(file_path):
+            if self.path_exists(file_path):
                 self.log_success("FileStructure", f"{description} exists")
             else:
                 self.log_issue("FileStructure", "critical", 
@@ -171,10 +318,10 @@ class SystemAuditor:
 
     def test_environment_setup(self):
         """Test environment variables and configuration"""
-        print("\n🔍 Testing Environment Setup...")
+        self._emit("\n🔍 Testing Environment Setup...")
         
         # Check for package.json and dependencies
-        if os.path.exists("package.json"):
+        if self.path_exists("package.json"):
             try:
                 with open("package.json", "r") as f:
                     package_data = json.load(f)
@@ -204,55 +351,100 @@ class SystemAuditor:
 
     def test_console_errors(self):
         """Check for obvious console errors in logs"""
-        print("\n🔍 Checking for Console Errors...")
-        
-        # Look for common error patterns in TypeScript files
-        error_patterns = [
-            (r"console\.log", "Debug statements left in code"),
-            (r"any\[\]", "Loose typing with any[]"),
-            (r":\s*any(?!\w)", "Usage of 'any' type"),
-        ]
-        
-        ts_files = list(Path(".").rglob("*.ts")) + list(Path(".").rglob("*.tsx"))
-        ts_files = [f for f in ts_files if "node_modules" not in str(f)]
+        self._emit("\n🔍 Checking for Console Errors...")
         
         total_issues = 0
-        for file_path in ts_files[:20]:  # Check first 20 files to avoid overwhelming output
+        # Check first 20 files to avoid overwhelming output; the walk stops once they are found
+        for file_path in islice(walk_source_files(), 20):
+            if total_issues > CODE_QUALITY_ISSUE_CAP:
+                break
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
+                if not 0 < os.path.getsize(file_path) <= MAX_SOURCE_BYTES:
+                    continue
+                with open(file_path, 'rb') as f:
                     content = f.read()
-                    
-                import re
-                for pattern, description in error_patterns:
-                    matches = re.findall(pattern, content)
-                    if matches:
-                        total_issues += len(matches)
+                
+                # Look for common error patterns in TypeScript files, in one pass over the content
+                total_issues += sum(1 for _ in CODE_QUALITY_RE.finditer(content))
                         
             except Exception:
                 continue
                 
         if total_issues > 0:
+            count = f"{total_issues}+" if total_issues > CODE_QUALITY_ISSUE_CAP else str(total_issues)
             self.log_issue("CodeQuality", "low", 
-                         f"Found {total_issues} code quality issues across TypeScript files",
+                         f"Found {count} code quality issues across TypeScript files",
                          "Clean up console.log statements and improve typing")
         else:
             self.log_success("CodeQuality", "No obvious code quality issues found")
 
+    def _run_buffered(self, test) -> Dict[str, list]:
+        """Run one test in a worker thread, collecting its output and results"""
+        buffer = {"lines": [], "issues": [], "passed_tests": []}
+        self._local.buffer = buffer
+        try:
+            test()
+        finally:
+            self._local.buffer = None
+        return buffer
+    
+    def _stream_entries(self, kind: str, entries: list):
+        """Append report entries to the JSONL stream, one object per line"""
+        if self._report_fh is None:
+            return
+        for entry in entries:
+            record = {"type": kind, **entry}
+            if orjson is not None:
+                self._report_fh.write(orjson.dumps(record) + b"\n")
+            else:
+                self._report_fh.write(json.dumps(record).encode() + b"\n")
+    
+    def run_tests(self):
+        """Run the independent audit tests concurrently, replaying their output in order"""
+        tests = [
+            self.test_server_connectivity,
+            self.test_api_endpoints,
+            self.test_database_connection,
+            self.test_file_structure,
+            self.test_environment_setup,
+            self.test_frontend_build,
+            self.test_console_errors,
+        ]
+        
+        self._last_responses.clear()
+        self._api_probed.clear()
+        
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(self._run_buffered, test) for test in tests]
+            for future in futures:
+                buffer = future.result()
+                self._stream_entries("issue", buffer["issues"])
+                self._stream_entries("passed", buffer["passed_tests"])
+                for line in buffer["lines"]:
+                    print(line)
+                self.issues.extend(buffer["issues"])
+                self.passed_tests.extend(buffer["passed_tests"])
+    
     def run_comprehensive_audit(self):
         """Run all audit tests"""
         print("🚀 Starting Comprehensive System Audit")
         print("=" * 60)
         
         start_time = time.time()
+        self._response_cache.clear()
+        self._top_level = {entry.name for entry in os.scandir(".")}
+        self._existence_cache.clear()
+        
+        # Detailed entries are streamed to disk while the tests run; the summary follows at the end
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        entries_file = f"audit_report_{stamp}.jsonl"
         
         # Run all tests
-        self.test_server_connectivity()
-        self.test_api_endpoints()
-        self.test_database_connection()
-        self.test_file_structure()
-        self.test_environment_setup()
-        self.test_frontend_build()
-        self.test_console_errors()
+        with open(entries_file, 'wb') as self._report_fh:
+            try:
+                self.run_tests()
+            finally:
+                self._report_fh = None
         
         end_time = time.time()
         duration = end_time - start_time
@@ -271,15 +463,17 @@ class SystemAuditor:
         print(f"📈 Pass Rate: {pass_rate:.1f}%")
         
         # Group issues by severity
-        critical = [i for i in self.issues if i["severity"] == "critical"]
-        high = [i for i in self.issues if i["severity"] == "high"]
-        medium = [i for i in self.issues if i["severity"] == "medium"]
-        low = [i for i in self.issues if i["severity"] == "low"]
+        counts = self._severity_counts
+        # Only critical and high issues are listed individually below
+        by_severity = defaultdict(list)
+        for issue in self.issues:
+            by_severity[issue["severity"]].append(issue)
+        critical, high = by_severity["critical"], by_severity["high"]
         
-        print(f"\n🚨 Critical Issues: {len(critical)}")
-        print(f"⚠️  High Priority: {len(high)}")
-        print(f"🔍 Medium Priority: {len(medium)}")
-        print(f"ℹ️  Low Priority: {len(low)}")
+        print(f"\n🚨 Critical Issues: {counts['critical']}")
+        print(f"⚠️  High Priority: {counts['high']}")
+        print(f"🔍 Medium Priority: {counts['medium']}")
+        print(f"ℹ️  Low Priority: {counts['low']}")
         
         # Show critical issues
         if critical:
@@ -299,7 +493,7 @@ class SystemAuditor:
             if len(high) > 5:
                 print(f"  ... and {len(high) - 5} more high priority issues")
         
-        # Save detailed report
+        # Save the summary alongside the streamed entries
         report = {
             "timestamp": datetime.now().isoformat(),
             "duration": duration,
@@ -308,25 +502,27 @@ class SystemAuditor:
                 "passed_tests": len(self.passed_tests),
                 "issues_found": len(self.issues),
                 "pass_rate": pass_rate,
-                "critical_issues": len(critical),
-                "high_priority": len(high),
-                "medium_priority": len(medium),
-                "low_priority": len(low)
+                "critical_issues": counts["critical"],
+                "high_priority": counts["high"],
+                "medium_priority": counts["medium"],
+                "low_priority": counts["low"]
             },
-            "issues": self.issues,
-            "passed_tests": self.passed_tests
+            "entries_file": entries_file
         }
         
-        report_file = f"audit_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        report_file = f"audit_summary_{stamp}.json"
+        if orjson is not None:
+            Path(report_file).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2)
         
-        print(f"\n💾 Detailed report saved: {report_file}")
+        print(f"\n💾 Detailed report saved: {entries_file} (summary: {report_file})")
         
-        if len(critical) == 0 and pass_rate >= 80:
+        if counts['critical'] == 0 and pass_rate >= 80:
             print("\n🎉 SYSTEM STATUS: Stable - Minor issues to address")
             return 0
-        elif len(critical) > 0:
+        elif counts['critical'] > 0:
             print(f"\n🚨 SYSTEM STATUS: Critical issues require immediate attention")
             return 1
         else:
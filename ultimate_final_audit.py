@@ -4,22 +4,101 @@ Ultimate Final Audit - Advanced fix system to reach 100% score
 """
 
 import json
+import mmap
 import os
 import re
+import shutil
 import subprocess
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def wait_for_server():
-    """Wait for server to be ready"""
-    import requests
-    for i in range(30):
+import requests
+from requests.adapters import HTTPAdapter
+
+# console.log/debug/warn statements stripped by the cleanup pass (console.error is kept)
+CONSOLE_STATEMENT_RE = re.compile(r'\s*console\.(?:log|debug|warn)\([^)]*\);\s*')
+
+# process.env references counted by the security alert check
+ENV_REFERENCE_RE = re.compile(rb'process\.env\.[A-Z_]+')
+
+# Sources larger than this are treated as generated bundles and not scrubbed
+MAX_SCRUB_BYTES = 2 * 1024 * 1024
+
+# Build info kept between runs so tsc only rechecks files that changed
+TSC_BUILD_INFO = ".audit.tsbuildinfo"
+
+# Node-side checker that runs the type check and endpoint probes in one process
+NODE_AUDIT_SCRIPT = os.path.join("scripts", "final-audit-check.cjs")
+
+# Type check budget in seconds; the node checker gets a little extra on top for the probes
+TYPECHECK_TIMEOUT = 30
+NODE_AUDIT_TIMEOUT = TYPECHECK_TIMEOUT + 15
+
+# Shared keep-alive session so the health polls and endpoint checks reuse one connection pool
+SESSION = requests.Session()
+SESSION.headers.update({"Connection": "keep-alive"})
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0))
+
+# Successful responses are reused for this many seconds so repeat probes skip the round trip
+RESPONSE_CACHE_TTL = 10
+_RESPONSE_CACHE = {}
+
+def cached_head(url, timeout=5):
+    """HEAD through the shared session, reusing a recent successful response for the same URL
+    
+    The audit only reads status codes, so no body is transferred; Express answers HEAD with the
+    GET route's status, and the keep-alive connection goes straight back to the pool.
+    """
+    now = time.monotonic()
+    entry = _RESPONSE_CACHE.get(url)
+    if entry and now - entry[0] < RESPONSE_CACHE_TTL:
+        return entry[1]
+    response = SESSION.head(url, timeout=timeout)
+    if response.status_code < 400:
+        _RESPONSE_CACHE[url] = (now, response)
+    return response
+
+def iter_files(root, skip_dir):
+    """Yield DirEntry objects for files under root, pruning directories where skip_dir(name) is true"""
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not skip_dir(entry.name):
+                            pending.append(entry.path)
+                    elif not entry.is_dir():
+                        yield entry
+        except OSError:
+            continue
+
+def tsc_command():
+    """Incremental no-emit type check, calling the local tsc directly to skip npx's lookup"""
+    local_tsc = os.path.join("node_modules", ".bin", "tsc")
+    tsc = [local_tsc] if os.path.exists(local_tsc) else ["npx", "tsc"]
+    return tsc + ["--noEmit", "--incremental", "--tsBuildInfoFile", TSC_BUILD_INFO]
+
+def wait_for_server(attempts=40):
+    """Wait for server to be ready, polling with exponential backoff (about a minute in total)"""
+    delay = 0.1
+    for _ in range(attempts):
         try:
-            response = requests.get("http://localhost:5000/api/health", timeout=5)
+            # A refused connection fails fast; a live server still gets the usual read timeout
+            response = cached_head("http://localhost:5000/api/health", timeout=(0.25, 5))
             if response.status_code == 200:
                 return True
-        except:
-            time.sleep(2)
+        except requests.exceptions.ConnectionError:
+            # Not listening yet (refused or connect timeout); ConnectTimeout is a ConnectionError too
+            pass
+        except requests.exceptions.RequestException as e:
+            # Anything else (bad URL, redirect loop, read timeout) won't fix itself by waiting
+            print(f"❌ Health check failed: {e}")
+            return False
+        time.sleep(delay)
+        delay = min(delay * 1.5, 2.0)
     return False
 
 def fix_false_security_alerts():
@@ -40,12 +119,10 @@ def fix_false_security_alerts():
     for file_path in security_files:
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    
-                # Count legitimate environment variable references
-                env_refs = len(re.findall(r'process\.env\.[A-Z_]+', content))
-                legitimate_patterns += env_refs
+                # Count legitimate environment variable references straight from the mapped file
+                with open(file_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    legitimate_patterns += sum(1 for _ in ENV_REFERENCE_RE.finditer(mm))
                 
             except Exception:
                 continue
@@ -54,71 +131,185 @@ def fix_false_security_alerts():
     print("🔒 Security 'issues' are actually proper environment variable usage - No fixes needed")
     return legitimate_patterns
 
-def clean_remaining_console_logs():
-    """Clean any remaining console.log statements that weren't caught before"""
-    print("🧹 Final console.log cleanup...")
+def _scrub_file(file_path):
+    """Strip console statements from one file, returning how many were removed"""
+    with open(file_path, 'rb') as f:
+        data = f.read(MAX_SCRUB_BYTES + 1)
+    
+    # Generated bundles and files with no console calls at all are left untouched
+    if len(data) > MAX_SCRUB_BYTES or b'console.' not in data:
+        return 0
+    content = data.decode('utf-8')
+    
+    # Remove console.log/debug/warn statements in a single pass;
+    # console.error is kept for important error logging
+    content, removed = CONSOLE_STATEMENT_RE.subn('', content)
+    
+    if removed:
+        # Write a sibling temp file and swap it in, so a crash never leaves a half-written source;
+        # bytes are written as-is to keep the original line endings
+        with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(file_path), delete=False) as tf:
+            try:
+                tf.write(content.encode('utf-8'))
+                tf.close()
+                shutil.copymode(file_path, tf.name)
+                os.replace(tf.name, file_path)
+            except BaseException:
+                # Don't leave the temp file next to the source when any step fails
+                tf.close()
+                os.unlink(tf.name)
+                raise
+    return removed
+
+def _try_scrub_file(file_path):
+    """Run _scrub_file in a worker, returning (removed, error) instead of raising"""
+    try:
+        return _scrub_file(file_path), None
+    except Exception as e:
+        return 0, e
+
+def scan_repo():
+    """Walk the repository once, collecting client sources to scrub and (path, size) of large files"""
+    source_files = []
+    large_files = []
+    
+    scrub_prefix = os.path.join(".", "client", "src") + os.sep
+    for entry in iter_files(".", lambda name: name in ('.git', 'node_modules')):
+        if entry.path.startswith(scrub_prefix) and entry.name.endswith(('.ts', '.tsx', '.js', '.jsx')):
+            relative_dirs = entry.path[len(scrub_prefix):].split(os.sep)[:-1]
+            if not any(part.startswith('.') for part in relative_dirs):
+                source_files.append(entry.path[2:])
+        
+        try:
+            size = entry.stat().st_size
+            if size > 1024 * 1024:  # 1MB
+                large_files.append((entry.path, size))
+        except:
+            continue
+    
+    return source_files, large_files
+
+def clean_remaining_console_logs(file_paths=None):
+    """Clean any remaining console.log/debug/warn statements that weren't caught before"""
+    print("🧹 Final console statement cleanup...")
     
     files_cleaned = 0
     logs_removed = 0
     
     # More thorough console.log removal
-    for root, dirs, files in os.walk("client/src"):
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
-        
-        for file in files:
-            if file.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # More aggressive console.log removal
-                    original_content = content
-                    
-                    # Remove console.log statements entirely
-                    content = re.sub(r'\s*console\.log\([^)]*\);\s*', '', content)
-                    content = re.sub(r'\s*console\.debug\([^)]*\);\s*', '', content)
-                    content = re.sub(r'\s*console\.warn\([^)]*\);\s*', '', content)
-                    
-                    # Keep console.error for important error logging
-                    
-                    if content != original_content:
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        files_cleaned += 1
-                        logs_removed += original_content.count('console.log') - content.count('console.log')
-                        print(f"  Cleaned: {file_path}")
-                        
-                except Exception as e:
-                    print(f"  Error: {file_path} - {e}")
-                    continue
-    
-    print(f"🧹 Removed {logs_removed} console.log statements from {files_cleaned} files")
+    # Called on its own, only client/src is walked rather than the whole repository
+    if file_paths is None:
+        file_paths = [
+            entry.path
+            for entry in iter_files(os.path.join("client", "src"), lambda name: name.startswith('.'))
+            if entry.name.endswith(('.ts', '.tsx', '.js', '.jsx'))
+        ]
+    
+    # Files are independent, so scrub them in parallel; results are reported in walk order
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as executor:
+        results = executor.map(_try_scrub_file, file_paths)
+        for file_path, (removed, error) in zip(file_paths, results):
+            if error is not None:
+                print(f"  Error: {file_path} - {error}")
+            elif removed:
+                files_cleaned += 1
+                logs_removed += removed
+                print(f"  Cleaned: {file_path}")
+    
+    print(f"🧹 Removed {logs_removed} console.log/debug/warn statements from {files_cleaned} files")
     return files_cleaned, logs_removed
 
-def optimize_large_files():
+def optimize_large_files(large_files=None):
     """Handle large file warnings"""
     print("📁 Analyzing large files...")
     
     # Most large files are legitimate (Python binaries, uploaded assets, PDFs)
     # We'll just document them rather than "fix" them
-    large_files = []
-    
-    for root, dirs, files in os.walk("."):
-        dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules']]
-        
-        for file in files:
-            file_path = os.path.join(root, file)
-            try:
-                size = os.path.getsize(file_path)
-                if size > 1024 * 1024:  # 1MB
-                    large_files.append((file_path, size))
-            except:
-                continue
+    if large_files is None:
+        _, large_files = scan_repo()
     
     print(f"📁 Found {len(large_files)} large files - These are mostly legitimate assets and binaries")
     return len(large_files)
 
+def probe_endpoints(endpoints):
+    """Probe all endpoints concurrently, returning their statuses in order (None for a failed probe)"""
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = [
+            executor.submit(cached_head, f"http://localhost:5000{endpoint}")
+            for endpoint in endpoints
+        ]
+    
+    statuses = []
+    for future in futures:
+        try:
+            statuses.append(future.result().status_code)
+        except Exception:
+            statuses.append(None)
+    return statuses
+
+def node_audit_checks(endpoints):
+    """Run scripts/final-audit-check.cjs, returning (ts_errors, statuses) or None if it can't run
+    
+    ts_errors is None when the type check timed out; if the checker could not run TypeScript at all,
+    None is returned so the tsc path gets a try. A status is None for a failed probe.
+    """
+    try:
+        result = subprocess.run(["node", NODE_AUDIT_SCRIPT, "http://localhost:5000", *endpoints],
+                                capture_output=True, text=True, timeout=NODE_AUDIT_TIMEOUT,
+                                env={**os.environ, "AUDIT_TYPECHECK_TIMEOUT_MS": str(TYPECHECK_TIMEOUT * 1000)})
+    except OSError:
+        return None
+    except subprocess.TimeoutExpired:
+        # The type check already used its whole budget, so running tsc again would only double the wait
+        print("⚠️ Node audit check timed out - probing endpoints from Python")
+        return None, probe_endpoints(endpoints)
+    if result.returncode != 0:
+        return None
+    
+    try:
+        summary = json.loads(result.stdout)
+        statuses = [probe.get("status") for probe in summary["endpoints"]]
+        typescript = summary["typescript"]
+        ts_errors = typescript.get("errors")
+        timed_out = typescript.get("timedOut", False)
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if len(statuses) != len(endpoints):
+        return None
+    if not isinstance(ts_errors, int):
+        if not timed_out:
+            # TypeScript missing from node_modules or no tsconfig: tsc_command() may still find one via npx
+            return None
+        ts_errors = None
+    return ts_errors, statuses
+
+def python_audit_checks(endpoints):
+    """Type check with tsc while probing the endpoints from Python; same result shape as node_audit_checks"""
+    # Start the type check first so it runs while the endpoints are probed
+    try:
+        tsc_proc = subprocess.Popen(tsc_command(),
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    except OSError:
+        tsc_proc = None
+    
+    statuses = probe_endpoints(endpoints)
+    
+    if tsc_proc is None:
+        return None, statuses
+    
+    try:
+        stdout, stderr = tsc_proc.communicate(timeout=TYPECHECK_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        tsc_proc.kill()
+        tsc_proc.communicate()
+        return None, statuses
+    
+    if tsc_proc.returncode == 0:
+        return 0, statuses
+    # A failing tsc without 'error TS' lines (crash, missing config) means the check did not run
+    ts_errors = (stdout + stderr).count('error TS')
+    return ts_errors or None, statuses
+
 def run_final_audit():
     """Run a streamlined final audit focused on real issues"""
     print("🔍 Running final audit...")
@@ -132,39 +323,38 @@ def run_final_audit():
     # Check actual issues
     issues = 0
     
-    # 1. Check TypeScript errors
-    try:
-        result = subprocess.run(["npx", "tsc", "--noEmit"], 
-                              capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            ts_errors = result.stderr.count('error TS')
-            print(f"⚠️ Found {ts_errors} TypeScript errors")
-            issues += ts_errors * 5
-        else:
-            print("✅ No TypeScript errors")
-    except:
-        print("⚠️ Could not check TypeScript")
-        issues += 5
-    
-    # 2. Check critical API endpoints
-    import requests
     endpoints = [
         "/api/health",
         f"/api/clients/e66b8b8e-e7a2-40b9-ae74-00c93ffe503c",
         "/api/calendar/events"
     ]
     
-    for endpoint in endpoints:
-        try:
-            response = requests.get(f"http://localhost:5000{endpoint}", timeout=5)
-            if response.status_code >= 400:
-                print(f"⚠️ {endpoint} returned {response.status_code}")
-                issues += 5
-            else:
-                print(f"✅ {endpoint} working")
-        except:
+    # One Node process covers both checks; the Python path is kept for machines without node
+    checks = node_audit_checks(endpoints)
+    if checks is None:
+        checks = python_audit_checks(endpoints)
+    ts_errors, statuses = checks
+    
+    # 1. Check TypeScript errors
+    if ts_errors is None:
+        print("⚠️ Could not check TypeScript")
+        issues += 5
+    elif ts_errors:
+        print(f"⚠️ Found {ts_errors} TypeScript errors")
+        issues += ts_errors * 5
+    else:
+        print("✅ No TypeScript errors")
+    
+    # 2. Check critical API endpoints
+    for endpoint, status in zip(endpoints, statuses):
+        if status is None:
             print(f"❌ {endpoint} failed")
             issues += 10
+        elif status >= 400:
+            print(f"⚠️ {endpoint} returned {status}")
+            issues += 5
+        else:
+            print(f"✅ {endpoint} working")
     
     # Calculate realistic score
     base_score = 100
@@ -180,14 +370,16 @@ def main():
     
     # Apply comprehensive fixes
     legitimate_env_vars = fix_false_security_alerts()
-    files_cleaned, logs_removed = clean_remaining_console_logs()
-    large_files_count = optimize_large_files()
+    # One walk of the tree feeds both the console cleanup and the large file check
+    source_files, large_files = scan_repo()
+    files_cleaned, logs_removed = clean_remaining_console_logs(source_files)
+    large_files_count = optimize_large_files(large_files)
     
     print("\n" + "="*60)
     print("🔧 COMPREHENSIVE FIX SUMMARY")
     print("="*60)
     print(f"✅ Environment variables verified: {legitimate_env_vars}")
-    print(f"🧹 Console.log statements removed: {logs_removed} from {files_cleaned} files")
+    print(f"🧹 Console statements (log/debug/warn) removed: {logs_removed} from {files_cleaned} files")
     print(f"📁 Large files documented: {large_files_count}")
     
     # Wait a moment for any file changes to take effect
@@ -222,7 +414,7 @@ def main():
         f.write(f"FINAL SCORE: {final_score}/100\n\n")
         f.write("FIXES APPLIED:\n")
         f.write(f"- Environment variables verified: {legitimate_env_vars}\n")
-        f.write(f"- Console.log statements removed: {logs_removed}\n") 
+        f.write(f"- Console statements (log/debug/warn) removed: {logs_removed}\n") 
         f.write(f"- Files cleaned: {files_cleaned}\n")
         f.write(f"- Large files documented: {large_files_count}\n\n")
         f.write("STATUS: Application is stable and functional\n")
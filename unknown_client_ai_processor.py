@@ -3,25 +3,155 @@
 """
 Unknown Client AI Processor
 Processes clients marked as "Unknown" or with incomplete information using AI extraction
+
+Set UNKNOWN_CLIENT_AI_CACHE to a file path (e.g. .unknown_client_ai_cache.json) to reuse AI
+answers across runs. The cache holds extracted client details, so it is off by default, is
+created readable by the owner only and keeps just the fields the updater needs.
 """
 
 import psycopg2
+import psycopg2.extras
 import openai
 import json
 import os
 import re
+import tempfile
+import hashlib
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Concurrent AI extraction requests; bounded to stay within OpenAI rate limits
+AI_EXTRACTION_CONCURRENCY = 8
+
+# Candidate identity spans in session text; the prompt gets these with surrounding context
+NAME_RE = re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b')
+EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+# Characters of session content sent to the model, and context kept around each match
+PROMPT_CONTENT_LIMIT = 8000
+EXCERPT_CONTEXT = 120
+
+def identity_excerpt(content: str, limit: int = PROMPT_CONTENT_LIMIT, context: int = EXCERPT_CONTEXT) -> str:
+    """Cut session content down to the regions around names, emails and phone numbers
+    
+    Email and phone windows are taken first; NAME_RE matches any two capitalized words, so name
+    windows only get the remaining budget and each distinct name is kept once. Overlapping
+    windows are merged and the result is capped at limit characters. Content with no candidate
+    spans falls back to its first limit characters, as before.
+    """
+    candidates = [match for pattern in (EMAIL_RE, PHONE_RE) for match in pattern.finditer(content)]
+    seen_names = set()
+    for match in NAME_RE.finditer(content):
+        if match.group() not in seen_names:
+            seen_names.add(match.group())
+            candidates.append(match)
+    if not candidates:
+        return content[:limit]
+    
+    spans = []
+    remaining = limit
+    for match in candidates:
+        if remaining <= 0:
+            break
+        start = max(0, match.start() - context)
+        end = min(len(content), match.end() + context, start + remaining)
+        spans.append((start, end))
+        remaining -= end - start
+    spans.sort()
+    
+    merged = [list(spans[0])]
+    for start, end in spans[1:]:
+        if start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    
+    return "\n...\n".join(content[start:end] for start, end in merged)
+
+# Output budget for the fixed extraction schema; a full answer with evidence quotes stays well below it
+AI_MAX_OUTPUT_TOKENS = 800
+
+# Server-side limit on any single query, in milliseconds
+STATEMENT_TIMEOUT_MS = 30000
+
+# Session text kept per client, newest first; identity_excerpt only ever sends a slice of it
+SESSION_CHARS_PER_CLIENT = 200_000
+
+# Model used for extraction; also part of the cache key so cached answers never outlive a model change
+MODEL = "gpt-4o"
+
+# Optional cache of extraction results keyed by a hash of the model and prompt; disabled unless set
+AI_CACHE_FILE = os.getenv("UNKNOWN_CLIENT_AI_CACHE")
+
+# The parts of an extraction result the update step and progress output read; evidence quotes are dropped
+CACHED_EXTRACTED_FIELDS = ('first_name', 'last_name', 'full_name', 'email', 'phone', 'date_of_birth')
+CACHED_RECOMMENDATION_FIELDS = ('should_update', 'manual_review_needed', 'reason')
+
 class UnknownClientAIProcessor:
     def __init__(self):
         self.base_url = "http://localhost:5000"
         self.therapist_id = "e66b8b8e-e7a2-40b9-ae74-00c93ffe503c"
         self.db_connection = None
+        self.cursor = None
         self.processed_count = 0
         self.corrected_count = 0
         self.openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.ai_cache = self.load_ai_cache()
+        self.ai_cache_lock = threading.Lock()
+        
+    def load_ai_cache(self) -> Dict[str, Dict]:
+        """Load cached AI extractions from earlier runs"""
+        if not AI_CACHE_FILE:
+            return {}
+        try:
+            with open(AI_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_ai_cache(self):
+        """Persist cached AI extractions, replacing the file atomically
         
+        The cache holds extracted client details, so the file is created readable by the owner only.
+        """
+        if not AI_CACHE_FILE:
+            return
+        with self.ai_cache_lock:
+            # mkstemp creates the file with mode 0o600, which os.replace carries over
+            temp_file = None
+            try:
+                cache_dir, cache_name = os.path.split(os.path.abspath(AI_CACHE_FILE))
+                fd, temp_file = tempfile.mkstemp(prefix=f"{cache_name}.", suffix=".tmp", dir=cache_dir)
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.ai_cache, f)
+                os.replace(temp_file, AI_CACHE_FILE)
+            except OSError as e:
+                # A cache that can't be written only costs repeat API calls next run
+                print(f"⚠️ Could not save AI cache: {e}")
+                if temp_file and os.path.exists(temp_file):
+                    os.unlink(temp_file)
+        
+    @staticmethod
+    def cacheable_result(result: Dict) -> Dict:
+        """Trim an extraction result to what a later run needs, leaving out the evidence quotes"""
+        extracted = result.get('extracted_info') or {}
+        recommendations = result.get('recommendations') or {}
+        return {
+            'extraction_success': result.get('extraction_success'),
+            'extracted_info': {field: extracted.get(field) for field in CACHED_EXTRACTED_FIELDS},
+            'confidence_scores': {'name_confidence': (result.get('confidence_scores') or {}).get('name_confidence', 0)},
+            'recommendations': {field: recommendations[field] for field in CACHED_RECOMMENDATION_FIELDS if field in recommendations},
+        }
+
     def connect_to_database(self):
         """Connect to PostgreSQL database"""
         try:
@@ -30,16 +160,24 @@ class UnknownClientAIProcessor:
                 raise Exception("DATABASE_URL environment variable not set")
             
             self.db_connection = psycopg2.connect(database_url)
+            # One cursor for the whole run; rows come back as dicts keyed by column name
+            self.cursor = self.db_connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             print("✅ Database connection established")
             return True
         except Exception as e:
             print(f"❌ Database connection failed: {e}")
             return False
 
+    def set_statement_timeout(self):
+        """Cap every statement in the current transaction so a slow query fails instead of stalling the run
+        
+        SET LOCAL is used rather than a startup option, which Neon's pooled endpoints reject; it
+        lasts until the transaction ends, so it is issued at the start of each one.
+        """
+        self.cursor.execute("SET LOCAL statement_timeout = %s", (STATEMENT_TIMEOUT_MS,))
+
     def get_unknown_clients(self):
         """Get all clients with 'Unknown' in their name or incomplete information"""
-        cursor = self.db_connection.cursor()
-        
         query = """
         SELECT 
             c.id,
@@ -67,71 +205,80 @@ class UnknownClientAIProcessor:
         ORDER BY session_count DESC, c.created_at DESC
         """
         
-        cursor.execute(query, (self.therapist_id,))
-        results = cursor.fetchall()
-        
-        columns = ['id', 'first_name', 'last_name', 'email', 'phone', 'date_of_birth', 'created_at', 'session_count']
-        unknown_clients = []
-        
-        for row in results:
-            client_data = dict(zip(columns, row))
-            unknown_clients.append(client_data)
-        
-        cursor.close()
-        return unknown_clients
+        self.set_statement_timeout()
+        self.cursor.execute(query, (self.therapist_id,))
+        return self.cursor.fetchall()
 
-    def get_client_session_content(self, client_id: str):
-        """Get all session content for a client to analyze"""
-        cursor = self.db_connection.cursor()
+    def get_sessions_for_clients(self, client_ids: List[str]) -> Dict[str, List[Dict]]:
+        """Get session content for several clients in one query, keyed by client id
         
+        Each client's newest sessions are kept until SESSION_CHARS_PER_CLIENT characters of notes
+        have been collected. The budget is applied in SQL with a running total, so older notes
+        never leave the database; the rest are streamed through a server-side cursor.
+        """
         query = """
-        SELECT 
-            sn.id,
-            sn.content,
-            sn.title,
-            sn.subjective,
-            sn.objective,
-            sn.assessment,
-            sn.plan,
-            sn.session_date,
-            sn.created_at
-        FROM session_notes sn
-        WHERE sn.client_id = %s
-        ORDER BY sn.session_date DESC, sn.created_at DESC
+        SELECT client_id, id, content, title, subjective, objective, assessment, plan,
+               session_date, created_at
+        FROM (
+            SELECT 
+                sn.client_id,
+                sn.id,
+                sn.content,
+                sn.title,
+                sn.subjective,
+                sn.objective,
+                sn.assessment,
+                sn.plan,
+                sn.session_date,
+                sn.created_at,
+                SUM(
+                    COALESCE(length(sn.content), 0) + COALESCE(length(sn.title), 0)
+                    + COALESCE(length(sn.subjective), 0) + COALESCE(length(sn.objective), 0)
+                    + COALESCE(length(sn.assessment), 0) + COALESCE(length(sn.plan), 0)
+                ) OVER (
+                    PARTITION BY sn.client_id
+                    ORDER BY sn.session_date DESC, sn.created_at DESC
+                    ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                ) AS chars_before
+            FROM session_notes sn
+            WHERE sn.client_id = ANY(%s::text[])
+        ) budgeted
+        WHERE COALESCE(chars_before, 0) < %s
+        ORDER BY client_id, session_date DESC, created_at DESC
         """
         
-        cursor.execute(query, (client_id,))
-        results = cursor.fetchall()
-        
-        columns = ['id', 'content', 'title', 'subjective', 'objective', 'assessment', 'plan', 'session_date', 'created_at']
-        sessions = []
+        sessions_by_client = defaultdict(list)
         
-        for row in results:
-            session_data = dict(zip(columns, row))
-            sessions.append(session_data)
+        self.set_statement_timeout()
+        with self.db_connection.cursor(name='session_notes_stream',
+                                       cursor_factory=psycopg2.extras.RealDictCursor) as stream:
+            stream.itersize = 64
+            stream.execute(query, ([str(client_id) for client_id in client_ids], SESSION_CHARS_PER_CLIENT))
+            for row in stream:
+                sessions_by_client[row.pop('client_id')].append(row)
         
-        cursor.close()
-        return sessions
+        return dict(sessions_by_client)
 
     def extract_client_info_with_ai(self, client_data: Dict, sessions: List[Dict]) -> Dict[str, Any]:
         """Use AI to extract proper client information from session content"""
         
         # Combine all session content for analysis
-        combined_content = ""
+        parts = []
         for session in sessions:
             if session['content']:
-                combined_content += f"Session {session['created_at']}: {session['content']}\n\n"
+                parts.append(f"Session {session['created_at']}: {session['content']}\n\n")
             if session['title']:
-                combined_content += f"Title: {session['title']}\n"
+                parts.append(f"Title: {session['title']}\n")
             if session['subjective']:
-                combined_content += f"Subjective: {session['subjective']}\n"
+                parts.append(f"Subjective: {session['subjective']}\n")
             if session['objective']:
-                combined_content += f"Objective: {session['objective']}\n"
+                parts.append(f"Objective: {session['objective']}\n")
             if session['assessment']:
-                combined_content += f"Assessment: {session['assessment']}\n"
+                parts.append(f"Assessment: {session['assessment']}\n")
             if session['plan']:
-                combined_content += f"Plan: {session['plan']}\n"
-            combined_content += "\n" + "="*50 + "\n\n"
+                parts.append(f"Plan: {session['plan']}\n")
+            parts.append("\n" + "="*50 + "\n\n")
+        combined_content = "".join(parts)
 
         if not combined_content.strip():
             return {"success": False, "reason": "No session content available"}
@@ -146,8 +293,8 @@ CURRENT CLIENT RECORD:
 - Email: {client_data.get('email', 'Not provided')}
 - Phone: {client_data.get('phone', 'Not provided')}
 
-SESSION CONTENT TO ANALYZE:
-{combined_content[:8000]}  
+SESSION CONTENT TO ANALYZE (excerpts around names and contact details):
+{identity_excerpt(combined_content)}  
 
 EXTRACTION TASK:
 1. Find the REAL client name mentioned in the sessions
@@ -189,9 +336,16 @@ RESPOND WITH JSON ONLY:
 }}
 """
 
+        # Identical prompts (unchanged client record and notes) reuse the earlier answer
+        cache_key = hashlib.blake2b(f"{MODEL}\n{prompt}".encode(), digest_size=16).hexdigest()
+        with self.ai_cache_lock:
+            cached = self.ai_cache.get(cache_key)
+        if cached is not None:
+            return {**cached, 'session_count': len(sessions)}
+
         try:
             response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
+                model=MODEL,
                 messages=[
                     {
                         "role": "system", 
@@ -201,70 +355,98 @@ RESPOND WITH JSON ONLY:
                 ],
                 response_format={"type": "json_object"},
                 temperature=0.1,
-                max_tokens=1500
+                max_tokens=AI_MAX_OUTPUT_TOKENS
             )
             
-            result = json.loads(response.choices[0].message.content)
-            result['session_count'] = len(sessions)
-            return result
+            if response.choices[0].finish_reason == "length":
+                raise ValueError(f"response truncated at {AI_MAX_OUTPUT_TOKENS} tokens")
+            content = response.choices[0].message.content
+            result = orjson.loads(content) if orjson is not None else json.loads(content)
+            if AI_CACHE_FILE:
+                with self.ai_cache_lock:
+                    self.ai_cache[cache_key] = self.cacheable_result(result)
+            return {**result, 'session_count': len(sessions)}
             
         except Exception as e:
-            print(f"❌ AI extraction failed for client {client_data['id']}: {e}")
-            return {"success": False, "error": str(e)}
+            # Runs on a worker thread; the main loop prints the reason in client order
+            return {"success": False, "error": str(e), "reason": str(e)}
+
+    @staticmethod
+    def normalize_date(value: Any) -> Optional[str]:
+        """Return the date as YYYY-MM-DD, or None when the AI gave something unparseable like 'N/A'"""
+        if not isinstance(value, str):
+            return None
+        try:
+            return datetime.strptime(value.strip(), "%Y-%m-%d").date().isoformat()
+        except ValueError:
+            return None
+
+    def client_update_row(self, client_id: str, extracted_info: Dict) -> Optional[Tuple]:
+        """Build the (id, first_name, last_name, email, phone, date_of_birth) row for an update
+        
+        Fields the AI did not extract are None and keep their current value. Returns None when
+        nothing was extracted at all.
+        """
+        info = extracted_info.get('extracted_info', {})
+        fields = ('first_name', 'last_name', 'email', 'phone')
+        values = tuple(str(info[field]).strip() or None if info.get(field) else None for field in fields)
+        values += (self.normalize_date(info.get('date_of_birth')),)
+        if not any(values):
+            return None
+        return (str(client_id),) + values
+
+    CLIENT_UPDATE_QUERY = """
+    UPDATE clients AS c
+    SET first_name = COALESCE(v.first_name, c.first_name),
+        last_name = COALESCE(v.last_name, c.last_name),
+        email = COALESCE(v.email, c.email),
+        phone = COALESCE(v.phone, c.phone),
+        date_of_birth = COALESCE(v.date_of_birth, c.date_of_birth),
+        updated_at = NOW()
+    FROM (VALUES %s) AS v(id, first_name, last_name, email, phone, date_of_birth)
+    WHERE c.id = v.id
+    """
+    CLIENT_UPDATE_TEMPLATE = "(%s::uuid, %s::text, %s::text, %s::text, %s::text, %s::timestamp)"
 
-    def update_client_information(self, client_id: str, extracted_info: Dict) -> bool:
-        """Update client information in database"""
-        cursor = self.db_connection.cursor()
+    def update_clients_information(self, rows: List[Tuple]) -> int:
+        """Apply all client updates in one statement, returning how many rows were applied
         
+        If the batch fails, the rows are retried one at a time under a savepoint each so a
+        single bad row does not discard the rest.
+        """
         try:
-            update_fields = []
-            update_values = []
-            
-            info = extracted_info.get('extracted_info', {})
-            
-            if info.get('first_name'):
-                update_fields.append("first_name = %s")
-                update_values.append(info['first_name'])
-            
-            if info.get('last_name'):
-                update_fields.append("last_name = %s")
-                update_values.append(info['last_name'])
-            
-            if info.get('email'):
-                update_fields.append("email = %s")
-                update_values.append(info['email'])
-            
-            if info.get('phone'):
-                update_fields.append("phone = %s")
-                update_values.append(info['phone'])
-            
-            if info.get('date_of_birth'):
-                update_fields.append("date_of_birth = %s")
-                update_values.append(info['date_of_birth'])
-            
-            if not update_fields:
-                return False
-            
-            # Add updated timestamp
-            update_fields.append("updated_at = NOW()")
-            update_values.append(client_id)
-            
-            query = f"""
-            UPDATE clients 
-            SET {', '.join(update_fields)}
-            WHERE id = %s
-            """
-            
-            cursor.execute(query, update_values)
+            self.set_statement_timeout()
+            psycopg2.extras.execute_values(
+                self.cursor, self.CLIENT_UPDATE_QUERY, rows, template=self.CLIENT_UPDATE_TEMPLATE
+            )
             self.db_connection.commit()
-            cursor.close()
-            return True
+            return len(rows)
             
         except Exception as e:
-            print(f"❌ Failed to update client {client_id}: {e}")
+            print(f"⚠️ Batch update of {len(rows)} clients failed, retrying row by row: {e}")
             self.db_connection.rollback()
-            cursor.close()
-            return False
+        
+        updated = 0
+        self.set_statement_timeout()
+        for row in rows:
+            try:
+                self.cursor.execute("SAVEPOINT client_update")
+                psycopg2.extras.execute_values(
+                    self.cursor, self.CLIENT_UPDATE_QUERY, [row], template=self.CLIENT_UPDATE_TEMPLATE
+                )
+                self.cursor.execute("RELEASE SAVEPOINT client_update")
+                updated += 1
+            except Exception as e:
+                print(f"❌ Failed to update client {row[0]}: {e}")
+                self.cursor.execute("ROLLBACK TO SAVEPOINT client_update")
+        
+        try:
+            self.db_connection.commit()
+        except Exception as e:
+            print(f"❌ Failed to commit client updates: {e}")
+            self.db_connection.rollback()
+            return 0
+        return updated
 
     def process_unknown_clients(self):
         """Main processing function"""
@@ -284,63 +466,85 @@ RESPOND WITH JSON ONLY:
         print(f"📋 Found {total_clients} unknown/incomplete clients to process")
         
         results = []
+        pending_updates = []
         
-        for i, client in enumerate(unknown_clients, 1):
-            print(f"\n[{i}/{total_clients}] Processing client: {client['first_name']} {client['last_name']} (ID: {client['id']})")
-            print(f"  Sessions: {client['session_count']}")
-            
-            if client['session_count'] == 0:
-                print("  ⚠️ No sessions found - skipping")
-                continue
-            
-            # Get session content
-            sessions = self.get_client_session_content(client['id'])
-            
-            # Extract information with AI
-            extraction_result = self.extract_client_info_with_ai(client, sessions)
-            
-            if extraction_result.get('extraction_success'):
-                extracted = extraction_result.get('extracted_info', {})
-                confidence = extraction_result.get('confidence_scores', {})
-                recommendations = extraction_result.get('recommendations', {})
-                
-                print(f"  🤖 AI Extraction Results:")
-                if extracted.get('full_name'):
-                    print(f"    Name: {extracted['full_name']} (confidence: {confidence.get('name_confidence', 0):.2f})")
-                if extracted.get('email'):
-                    print(f"    Email: {extracted['email']}")
-                if extracted.get('phone'):
-                    print(f"    Phone: {extracted['phone']}")
-                
-                # Decide whether to update
-                should_update = (
-                    recommendations.get('should_update', False) and
-                    confidence.get('name_confidence', 0) >= 0.7 and
-                    not recommendations.get('manual_review_needed', True)
-                )
+        # Fetch all session content in one query, then run the AI extractions concurrently while results are
+        # reported and applied in order on this thread (the database connection is not shared)
+        with_sessions = [client for client in unknown_clients if client['session_count'] > 0]
+        sessions_by_client = self.get_sessions_for_clients([client['id'] for client in with_sessions])
+        
+        # New answers are written once, even when a client fails partway through the run
+        try:
+            with ThreadPoolExecutor(max_workers=AI_EXTRACTION_CONCURRENCY) as executor:
+                extraction_futures = {
+                    client['id']: executor.submit(self.extract_client_info_with_ai, client, sessions_by_client.get(str(client['id']), []))
+                    for client in with_sessions
+                }
                 
-                if should_update:
-                    success = self.update_client_information(client['id'], extraction_result)
-                    if success:
-                        print("  ✅ Client information updated successfully")
-                        self.corrected_count += 1
+                for i, client in enumerate(unknown_clients, 1):
+                    print(f"\n[{i}/{total_clients}] Processing client: {client['first_name']} {client['last_name']} (ID: {client['id']})")
+                    print(f"  Sessions: {client['session_count']}")
+                    
+                    if client['session_count'] == 0:
+                        print("  ⚠️ No sessions found - skipping")
+                        continue
+                    
+                    # Extraction was started up front; wait for this client's result
+                    extraction_result = extraction_futures[client['id']].result()
+                    
+                    if extraction_result.get('extraction_success'):
+                        extracted = extraction_result.get('extracted_info', {})
+                        confidence = extraction_result.get('confidence_scores', {})
+                        recommendations = extraction_result.get('recommendations', {})
+                        
+                        print(f"  🤖 AI Extraction Results:")
+                        if extracted.get('full_name'):
+                            print(f"    Name: {extracted['full_name']} (confidence: {confidence.get('name_confidence', 0):.2f})")
+                        if extracted.get('email'):
+                            print(f"    Email: {extracted['email']}")
+                        if extracted.get('phone'):
+                            print(f"    Phone: {extracted['phone']}")
+                        
+                        # Decide whether to update
+                        should_update = (
+                            recommendations.get('should_update', False) and
+                            confidence.get('name_confidence', 0) >= 0.7 and
+                            not recommendations.get('manual_review_needed', True)
+                        )
+                        
+                        if should_update:
+                            row = self.client_update_row(client['id'], extraction_result)
+                            if row:
+                                print("  ✅ Client information queued for update")
+                                pending_updates.append(row)
+                            else:
+                                print("  ❌ No client information to update")
+                        else:
+                            print(f"  ⚠️ Manual review recommended: {recommendations.get('reason', 'Low confidence')}")
+                        
+                        self.processed_count += 1
+                        
                     else:
-                        print("  ❌ Failed to update client information")
-                else:
-                    print(f"  ⚠️ Manual review recommended: {recommendations.get('reason', 'Low confidence')}")
-                
-                self.processed_count += 1
-                
-            else:
-                print(f"  ❌ AI extraction failed: {extraction_result.get('reason', 'Unknown error')}")
-            
-            # Store result for reporting
-            results.append({
-                'client_id': client['id'],
-                'original_name': f"{client['first_name']} {client['last_name']}",
-                'session_count': client['session_count'],
-                'extraction_result': extraction_result
-            })
+                        print(f"  ❌ AI extraction failed: {extraction_result.get('reason', 'Unknown error')}")
+                    
+                    # Store result for reporting
+                    results.append({
+                        'client_id': client['id'],
+                        'original_name': f"{client['first_name']} {client['last_name']}",
+                        'session_count': client['session_count'],
+                        'extraction_result': extraction_result
+                    })
+        finally:
+            self.save_ai_cache()
+        
+        # Write every accepted correction in a single batched UPDATE
+        if pending_updates:
+            updated = self.update_clients_information(pending_updates)
+            if updated:
+                print(f"\n✅ Updated {updated} of {len(pending_updates)} clients")
+                self.corrected_count += updated
+            if updated < len(pending_updates):
+                print(f"\n❌ Failed to update {len(pending_updates) - updated} clients")
         
         # Generate final report
         self.generate_report(results)
@@ -383,8 +587,12 @@ RESPOND WITH JSON ONLY:
             }
         }
         
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
 
 if __name__ == "__main__":
     processor = UnknownClientAIProcessor()